@@ -851,10 +851,12 @@ class MainClientWindow(QMainWindow):
             self.on_installation_detected, Qt.ConnectionType.QueuedConnection
         )
         
-        from .installation_monitor import InstallationMonitor
-        self.installation_monitor = InstallationMonitor(
-            signal_emitter=self.installation_monitor_signals
-        )
+        # Ссылка на общий монитор берется только на время мониторинга
+        # (см. start_installation_monitor / stop_installation_monitor)
+        self.installation_monitor = None
+        
+        # Заранее импортируем красный экран (QtMultimedia), чтобы тревога не ждала импорта
+        from . import red_alert_screen  # noqa: F401
 
         # WebSocket клиент
         self.client_thread = ClientThread(server_url)
@@ -1097,9 +1099,8 @@ class MainClientWindow(QMainWindow):
         """Принудительное закрытие приложения"""
         logger.info("Force exit requested - closing application")
         
-        # Останавливаем мониторинг установки
-        if self.installation_monitor:
-            self.installation_monitor.stop()
+        # Освобождаем общий монитор установки (останавливается при последней ссылке)
+        self.stop_installation_monitor()
         
         # Закрываем все окна
         if self.lock_screen:
@@ -1158,7 +1159,7 @@ class MainClientWindow(QMainWindow):
             # Автоматически запускаем мониторинг установки если включено в конфигурации
             if self.config.installation_monitor_enabled:
                 logger.info("[MainWindow] Auto-starting installation monitor (enabled in config)")
-                self.installation_monitor.start()
+                self.start_installation_monitor()
             else:
                 logger.info("[MainWindow] Installation monitor not started (disabled in config)")
 
@@ -1193,9 +1194,9 @@ class MainClientWindow(QMainWindow):
         logger.info("Session time finished - showing lock screen")
         
         # Останавливаем мониторинг установки если он был запущен
-        if self.installation_monitor.enabled:
+        if self.installation_monitor:
             logger.info("Stopping installation monitor (session time finished)")
-            self.installation_monitor.stop()
+            self.stop_installation_monitor()
 
         # Закрываем виджет таймера
         if self.timer_widget:
@@ -1250,9 +1251,9 @@ class MainClientWindow(QMainWindow):
         logger.info(f"Session stopped: {data}")
         
         # Останавливаем мониторинг установки если он был запущен
-        if self.installation_monitor.enabled:
+        if self.installation_monitor:
             logger.info("Stopping installation monitor (session stopped)")
-            self.installation_monitor.stop()
+            self.stop_installation_monitor()
 
         # Закрываем виджет таймера если активен
         if self.timer_widget:
@@ -1431,14 +1432,29 @@ class MainClientWindow(QMainWindow):
         
         # Запускаем или останавливаем мониторинг
         if enabled:
-            self.installation_monitor.start()
+            self.start_installation_monitor()
         else:
-            self.installation_monitor.stop()
+            self.stop_installation_monitor()
         
         # Обновляем статус в виджете таймера если он активен
         if self.timer_widget:
             self.timer_widget.set_installation_monitor_status(enabled)
     
+    def start_installation_monitor(self):
+        """Подключение к общему монитору установки (мониторинг идет, пока есть ссылки)"""
+        if self.installation_monitor is None:
+            from .installation_monitor import get_installation_monitor
+            self.installation_monitor = get_installation_monitor(
+                signal_emitter=self.installation_monitor_signals
+            )
+    
+    def stop_installation_monitor(self):
+        """Освобождение ссылки на общий монитор (последняя ссылка останавливает его)"""
+        if self.installation_monitor is not None:
+            from .installation_monitor import release_installation_monitor
+            release_installation_monitor(self.installation_monitor_signals)
+            self.installation_monitor = None
+    
     def on_timer_widget_monitor_toggle_requested(self, enabled: bool):
         """Обработка запроса переключения мониторинга от виджета таймера"""
         logger.info(f"Installation monitor toggle requested from timer widget: {enabled}")
@@ -1505,8 +1521,7 @@ class MainClientWindow(QMainWindow):
     def closeEvent(self, event):
         """Обработка закрытия окна"""
         # Останавливаем мониторинг установки
-        if self.installation_monitor:
-            self.installation_monitor.stop()
+        self.stop_installation_monitor()
         
         # Минимизируем в трей вместо закрытия
         event.ignore()
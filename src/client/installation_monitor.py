@@ -1,30 +1,104 @@
 """
 Модуль мониторинга установки программ
 Отслеживает скачивание установочных файлов в базовые директории
+и (опционально) запуск процессов-установщиков
 """
 import os
 import sys
 import time
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Callable, Optional, Set
-from threading import Thread, Event
-from datetime import datetime, timedelta
+from typing import Callable, Iterator, List, Optional, Set, Tuple
+from threading import Thread, Event, Lock
 
 logger = logging.getLogger(__name__)
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+    logger.warning("psutil not available, installer process monitoring disabled")
+
+# Windows: быстрый перечень процессов через Toolhelp32 (один снимок вместо psutil.process_iter)
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+    
+    TH32CS_SNAPPROCESS = 0x00000002
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+    
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ('dwSize', wintypes.DWORD),
+            ('cntUsage', wintypes.DWORD),
+            ('th32ProcessID', wintypes.DWORD),
+            ('th32DefaultHeapID', ctypes.c_size_t),
+            ('th32ModuleID', wintypes.DWORD),
+            ('cntThreads', wintypes.DWORD),
+            ('th32ParentProcessID', wintypes.DWORD),
+            ('pcPriClassBase', wintypes.LONG),
+            ('dwFlags', wintypes.DWORD),
+            ('szExeFile', wintypes.WCHAR * wintypes.MAX_PATH),
+        ]
+    
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    _kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    _kernel32.Process32FirstW.restype = wintypes.BOOL
+    _kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    _kernel32.Process32NextW.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+    
+    def _enumerate_processes_win32() -> List[Tuple[int, str]]:
+        """Список (pid, имя exe) всех процессов через CreateToolhelp32Snapshot"""
+        snapshot = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+            raise ctypes.WinError(ctypes.get_last_error())
+        
+        try:
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            processes = []
+            
+            ok = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while ok:
+                processes.append((entry.th32ProcessID, entry.szExeFile))
+                ok = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+            return processes
+        finally:
+            _kernel32.CloseHandle(snapshot)
+
 
 class InstallationMonitor:
     """Мониторинг установки программ - отслеживание установочных файлов в базовых директориях"""
     
     # Расширения установочных файлов (зависят от платформы)
-    INSTALLER_EXTENSIONS = {'.exe', '.msi', '.bat', '.cmd', '.ps1', '.vbs', '.jar'}
+    INSTALLER_EXTENSIONS = frozenset({'.exe', '.msi', '.bat', '.cmd', '.ps1', '.vbs', '.jar'})
     
     # Добавляем специфичные расширения для других платформ
     if sys.platform == 'darwin':  # macOS
-        INSTALLER_EXTENSIONS.update({'.dmg', '.pkg'})
+        INSTALLER_EXTENSIONS = INSTALLER_EXTENSIONS | {'.dmg', '.pkg'}
     elif sys.platform.startswith('linux'):  # Linux
-        INSTALLER_EXTENSIONS.update({'.deb', '.rpm', '.sh'})
+        INSTALLER_EXTENSIONS = INSTALLER_EXTENSIONS | {'.deb', '.rpm', '.sh'}
+    
+    # Имена процессов-установщиков
+    INSTALLER_PROCESSES = frozenset({
+        'msiexec.exe', 'setup.exe', 'install.exe', 'installer.exe',
+        'unins000.exe', 'uninst.exe', 'uninstall.exe',
+        'inno_updater.exe', 'installshield.exe', 'wise.exe',
+        'nsis.exe', 'isetup.exe'
+    })
+    
+    # Системные процессы-исключения (не триггерят тревогу даже если содержат 'setup' или 'install')
+    SYSTEM_PROCESS_EXCLUSIONS = frozenset({
+        'trustedinstaller.exe',  # Windows Modules Installer (Windows Update service)
+        'tiworker.exe',  # Windows Update worker process
+        'wuauclt.exe',  # Windows Update AutoUpdate Client
+    })
     
     # Папки для мониторинга загрузок
     DOWNLOAD_FOLDERS = [
@@ -34,22 +108,38 @@ class InstallationMonitor:
         Path.home() / "Рабочий стол"
     ]
     
-    def __init__(self, on_installation_detected: Optional[Callable] = None, signal_emitter=None):
+    # Интервал повторной проверки существования папок загрузок (секунды)
+    FOLDERS_REFRESH_INTERVAL = 60
+    
+    # Максимальное число запоминаемых файлов (LRU), чтобы память не росла бесконечно
+    KNOWN_FILES_LIMIT = 4096
+    
+    def __init__(self, on_installation_detected: Optional[Callable] = None, signal_emitter=None,
+                 enable_process_monitor: bool = False):
         """
         Инициализация монитора
         
         Args:
             on_installation_detected: Callback при обнаружении установки (deprecated - use signal_emitter)
             signal_emitter: Qt signal emitter for thread-safe callbacks (InstallationMonitorSignals)
+            enable_process_monitor: Дополнительно отслеживать запуск процессов-установщиков (требует psutil)
         """
         self.on_installation_detected = on_installation_detected
-        self.signal_emitter = signal_emitter
+        # Получатели сигнала; у общего монитора их добавляет и убирает
+        # get_installation_monitor/release_installation_monitor
+        self.signal_emitters: List = [signal_emitter] if signal_emitter is not None else []
+        self.enable_process_monitor = enable_process_monitor and PSUTIL_AVAILABLE
         self.enabled = False
         self.monitoring_thread: Optional[Thread] = None
         self.stop_event = Event()
         
         # Отслеживание уже проверенных файлов
-        self.known_files: Set[str] = set()
+        self.known_files: "OrderedDict[str, None]" = OrderedDict()
+        self.known_processes: Set[int] = set()
+        
+        # Существующие папки загрузок (строки для os.scandir), обновляются раз в FOLDERS_REFRESH_INTERVAL
+        self._download_dirs: List[str] = []
+        self._folders_checked = 0.0
         
         # Инициализация - запоминаем текущие файлы
         self._initialize_known_state()
@@ -57,15 +147,27 @@ class InstallationMonitor:
     def _initialize_known_state(self):
         """Инициализация состояния - запоминаем текущие файлы"""
         try:
+            self._refresh_folders()
+            
             # Запоминаем существующие файлы в папках загрузок
-            for folder in self.DOWNLOAD_FOLDERS:
-                if folder.exists():
-                    for file_path in folder.iterdir():
-                        if file_path.is_file() and file_path.suffix.lower() in self.INSTALLER_EXTENSIONS:
-                            self.known_files.add(str(file_path))
+            for folder in self._download_dirs:
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if self._has_installer_extension(entry.name) and entry.is_file(follow_symlinks=False):
+                            self._remember_file(entry.path)
+            
+            # Запоминаем уже запущенные установщики
+            if self.enable_process_monitor:
+                self._remember_running_installers()
         except Exception as e:
             logger.error(f"Error initializing known state: {e}", exc_info=True)
     
+    def _remember_running_installers(self):
+        """Запоминаем уже запущенные установщики, чтобы не считать их новыми"""
+        for pid, name, _ in self._iter_processes():
+            if self._is_installer_process(name):
+                self.known_processes.add(pid)
+    
     def start(self):
         """Запуск мониторинга"""
         if self.enabled:
@@ -98,18 +200,113 @@ class InstallationMonitor:
     
     def _monitoring_loop(self):
         """Основной цикл мониторинга"""
-        while not self.stop_event.is_set():
+        # Проверка каждые 2 секунды; wait() возвращает True сразу после stop()
+        while not self.stop_event.wait(2):
             try:
+                # Проверка запущенных процессов-установщиков
+                if self.enable_process_monitor and self._check_installer_processes():
+                    self._trigger_alert("Обнаружен запуск установщика")
+                    break
+                
                 # Проверка новых файлов в папках загрузок
                 if self._check_download_folders():
                     self._trigger_alert("Обнаружено скачивание установочного файла")
                     break
                 
             except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}", exc_info=True)
-            
-            # Проверка каждые 2 секунды
-            self.stop_event.wait(2)
+                # Ошибки при остановке (например, исчезнувшие процессы) не логируем
+                if not self.stop_event.is_set():
+                    logger.error(f"Error in monitoring loop: {e}", exc_info=True)
+    
+    def _is_installer_process(self, name: str) -> bool:
+        """
+        Проверка имени процесса (в нижнем регистре) на установщик
+        
+        Args:
+            name: Имя процесса в нижнем регистре
+        """
+        # Пропускаем системные процессы из списка исключений
+        if name in self.SYSTEM_PROCESS_EXCLUSIONS:
+            return False
+        return name in self.INSTALLER_PROCESSES or 'setup' in name or 'install' in name
+    
+    def _iter_processes(self) -> Iterator[Tuple[int, str, Optional["psutil.Process"]]]:
+        """
+        Перечисление процессов: (pid, имя в нижнем регистре, psutil.Process или None)
+        
+        На Windows используется снимок Toolhelp32 без создания объектов psutil;
+        объект процесса запрашивается только для совпавших имен.
+        """
+        if sys.platform == 'win32':
+            try:
+                for pid, name in _enumerate_processes_win32():
+                    yield pid, name.lower(), None
+                return
+            except OSError as e:
+                logger.debug(f"Toolhelp32 snapshot failed, falling back to psutil: {e}")
+        
+        for proc in psutil.process_iter():
+            try:
+                yield proc.pid, proc.name().lower(), proc
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+    
+    def _check_installer_processes(self) -> bool:
+        """
+        Проверка запущенных процессов на новые установщики
+        
+        Returns:
+            True если обнаружен недавно запущенный установщик
+        """
+        now = time.time()
+        
+        try:
+            for pid, name, proc in self._iter_processes():
+                if pid in self.known_processes:
+                    continue
+                
+                if not self._is_installer_process(name):
+                    continue
+                
+                self.known_processes.add(pid)
+                
+                try:
+                    # create_time запрашиваем только для совпавших процессов
+                    create_time = (proc if proc is not None else psutil.Process(pid)).create_time()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+                
+                # Проверяем, что процесс запущен недавно (в последние 10 секунд)
+                if now - create_time < 10:
+                    logger.warning(f"Installer process detected: {name} (PID: {pid})")
+                    return True
+        
+        except Exception as e:
+            logger.error(f"Error checking installer processes: {e}", exc_info=True)
+        
+        return False
+    
+    def _has_installer_extension(self, name: str) -> bool:
+        """
+        Проверка расширения имени файла на установочное (без учета регистра)
+        
+        Одна проверка и для начального состояния, и для опроса: имена из одного
+        расширения (например, '.exe') тоже считаются установочными файлами.
+        """
+        dot = name.rfind('.')
+        return dot >= 0 and name[dot:].lower() in self.INSTALLER_EXTENSIONS
+    
+    def _remember_file(self, file_str: str):
+        """Добавление файла в известные с вытеснением самых старых записей"""
+        self.known_files[file_str] = None
+        self.known_files.move_to_end(file_str)
+        if len(self.known_files) > self.KNOWN_FILES_LIMIT:
+            self.known_files.popitem(last=False)
+    
+    def _refresh_folders(self):
+        """Обновление списка существующих папок загрузок"""
+        self._download_dirs = [str(folder) for folder in self.DOWNLOAD_FOLDERS if folder.exists()]
+        self._folders_checked = time.monotonic()
     
     def _check_download_folders(self) -> bool:
         """
@@ -118,38 +315,51 @@ class InstallationMonitor:
         Returns:
             True если обнаружен новый установочный файл
         """
+        # Несуществующие папки (например, локализованные) не проверяем на каждом тике
+        if time.monotonic() - self._folders_checked > self.FOLDERS_REFRESH_INTERVAL:
+            self._refresh_folders()
+        
+        # Локальные ссылки экономят поиск атрибутов на каждый файл
+        has_installer_extension = self._has_installer_extension
+        known_files = self.known_files
+        now_ns = time.time_ns()
+        
         try:
-            for folder in self.DOWNLOAD_FOLDERS:
-                if not folder.exists():
-                    continue
+            for folder in self._download_dirs:
+                try:
+                    # os.scandir отдает DirEntry с закешированным типом файла,
+                    # что избавляет от лишних stat() на каждый файл
+                    with os.scandir(folder) as it:
+                        for entry in it:
+                            # Проверяем расширение
+                            if not has_installer_extension(entry.name):
+                                continue
+                            
+                            try:
+                                if not entry.is_file(follow_symlinks=False):
+                                    continue
+                                
+                                file_str = entry.path
+                                
+                                # Пропускаем известные файлы
+                                if file_str in known_files:
+                                    known_files.move_to_end(file_str)
+                                    continue
+                                
+                                # Добавляем в известные
+                                self._remember_file(file_str)
+                                
+                                # Проверяем, что файл создан недавно (в последние 30 секунд)
+                                file_stat = entry.stat()
+                                if now_ns - file_stat.st_ctime_ns < 30_000_000_000:
+                                    logger.warning(f"New installer file detected: {file_str}")
+                                    return True
+                            
+                            except (OSError, PermissionError) as e:
+                                logger.debug(f"Cannot access file {entry.path}: {e}")
                 
-                for file_path in folder.iterdir():
-                    try:
-                        if not file_path.is_file():
-                            continue
-                        
-                        # Проверяем расширение
-                        if file_path.suffix.lower() not in self.INSTALLER_EXTENSIONS:
-                            continue
-                        
-                        file_str = str(file_path)
-                        
-                        # Пропускаем известные файлы
-                        if file_str in self.known_files:
-                            continue
-                        
-                        # Добавляем в известные
-                        self.known_files.add(file_str)
-                        
-                        # Проверяем, что файл создан недавно (в последние 30 секунд)
-                        file_stat = file_path.stat()
-                        create_time = datetime.fromtimestamp(file_stat.st_ctime)
-                        if datetime.now() - create_time < timedelta(seconds=30):
-                            logger.warning(f"New installer file detected: {file_path}")
-                            return True
-                    
-                    except (OSError, PermissionError) as e:
-                        logger.debug(f"Cannot access file {file_path}: {e}")
+                except (OSError, PermissionError) as e:
+                    logger.debug(f"Cannot scan folder {folder}: {e}")
         
         except Exception as e:
             logger.error(f"Error checking download folders: {e}", exc_info=True)
@@ -165,17 +375,89 @@ class InstallationMonitor:
         """
         logger.critical(f"INSTALLATION DETECTED: {reason}")
         
+        # Копия списка: получатели могут отключаться из GUI потока во время отправки
+        emitters = list(self.signal_emitters)
+        
         # Используем Qt signal для thread-safe вызова (приоритет)
-        if self.signal_emitter:
-            try:
-                # Emit signal - Qt automatically marshals to main thread
-                self.signal_emitter.installation_detected.emit(reason)
-                logger.info("Installation alert signal emitted successfully")
-            except Exception as e:
-                logger.error(f"Error emitting installation detected signal: {e}", exc_info=True)
+        if emitters:
+            for emitter in emitters:
+                try:
+                    # Emit signal - Qt automatically marshals to main thread
+                    emitter.installation_detected.emit(reason)
+                    logger.info("Installation alert signal emitted successfully")
+                except Exception as e:
+                    logger.error(f"Error emitting installation detected signal: {e}", exc_info=True)
         # Fallback на старый callback (может быть небезопасно для Qt)
         elif self.on_installation_detected:
             try:
                 self.on_installation_detected(reason)
             except Exception as e:
                 logger.error(f"Error calling installation detected callback: {e}", exc_info=True)
+
+
+# Общий монитор для всех компонентов процесса (один поток опроса вместо нескольких)
+_GLOBAL_MONITOR: Optional[InstallationMonitor] = None
+_GLOBAL_REFS = 0
+_MONITOR_LOCK = Lock()
+
+
+def get_installation_monitor(signal_emitter=None, enable_process_monitor: bool = False) -> InstallationMonitor:
+    """
+    Получение общего монитора установки (с подсчетом ссылок)
+    
+    Пока есть хотя бы одна ссылка, мониторинг запущен; остановка выполняется
+    только через release_installation_monitor.
+    
+    Args:
+        signal_emitter: Qt signal emitter, который будет получать сигнал installation_detected
+        enable_process_monitor: Дополнительно отслеживать запуск процессов-установщиков
+            (остается включенным, пока существует общий монитор)
+    
+    Returns:
+        Общий экземпляр InstallationMonitor
+    """
+    global _GLOBAL_MONITOR, _GLOBAL_REFS
+    
+    with _MONITOR_LOCK:
+        if _GLOBAL_MONITOR is None:
+            _GLOBAL_MONITOR = InstallationMonitor(enable_process_monitor=enable_process_monitor)
+        elif enable_process_monitor and PSUTIL_AVAILABLE and not _GLOBAL_MONITOR.enable_process_monitor:
+            _GLOBAL_MONITOR._remember_running_installers()
+            _GLOBAL_MONITOR.enable_process_monitor = True
+        
+        monitor = _GLOBAL_MONITOR
+        if signal_emitter is not None:
+            monitor.signal_emitters.append(signal_emitter)
+        _GLOBAL_REFS += 1
+        
+        if not monitor.enabled:
+            monitor.start()
+        return monitor
+
+
+def release_installation_monitor(signal_emitter=None):
+    """
+    Освобождение ссылки на общий монитор; последний вызов останавливает мониторинг
+    
+    Args:
+        signal_emitter: Qt signal emitter, переданный в get_installation_monitor
+    """
+    global _GLOBAL_MONITOR, _GLOBAL_REFS
+    
+    with _MONITOR_LOCK:
+        if _GLOBAL_MONITOR is None:
+            return
+        
+        # Отключенный получатель больше не получает сигналы тревоги
+        if signal_emitter is not None and signal_emitter in _GLOBAL_MONITOR.signal_emitters:
+            _GLOBAL_MONITOR.signal_emitters.remove(signal_emitter)
+        
+        _GLOBAL_REFS -= 1
+        if _GLOBAL_REFS > 0:
+            return
+        
+        monitor = _GLOBAL_MONITOR
+        _GLOBAL_MONITOR = None
+        _GLOBAL_REFS = 0
+    
+    monitor.stop()
@@ -1,15 +1,15 @@
 """
 Красный экран тревоги при обнаружении установки программ
 """
-import os
 import sys
+import time
 import logging
-import base64
-import threading
 from pathlib import Path
-from datetime import datetime
-from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QDialog, QLineEdit, QPushButton, QMessageBox
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QDialog, QLineEdit, QPushButton, QMessageBox,
+    QGraphicsOpacityEffect
+)
+from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QAbstractAnimation
 from PyQt6.QtGui import QFont, QColor, QPalette
 
 from ..shared.utils import verify_password
@@ -17,7 +17,7 @@ from ..shared.utils import verify_password
 logger = logging.getLogger(__name__)
 
 try:
-    from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+    from PyQt6.QtMultimedia import QSoundEffect
     from PyQt6.QtCore import QUrl
     MULTIMEDIA_AVAILABLE = True
 except ImportError:
@@ -31,44 +31,32 @@ try:
 except ImportError:
     WINSOUND_AVAILABLE = False
 
-# Встроенный аудио-файл сирены (base64 для встраивания в программу)
-SIREN_AUDIO_BASE64 = None  # Будет загружен при первом использовании
-_siren_audio_lock = threading.Lock()  # Lock для потокобезопасной загрузки
+# Файл сирены проигрывается напрямую, без промежуточных копий
+# (в сборке PyInstaller siren.wav лежит в корне бандла, см. client.spec)
+_SIREN_FILE = Path(__file__).parent.parent.parent / "siren.wav"
+_SIREN_PATH = str(_SIREN_FILE) if _SIREN_FILE.exists() else ""
+if not _SIREN_PATH:
+    logger.warning(f"Siren audio file not found: {_SIREN_FILE}")
 
 
-def load_siren_audio():
-    """Загрузка аудио-файла сирены (потокобезопасная)"""
-    global SIREN_AUDIO_BASE64
+# Интерфейс системной громкости Windows (pycaw), создается при первой тревоге
+_volume_endpoint = None
+
+
+def _get_volume_endpoint():
+    """Получение закешированного IAudioEndpointVolume динамиков по умолчанию"""
+    global _volume_endpoint
     
-    # Быстрая проверка без блокировки
-    if SIREN_AUDIO_BASE64 is not None:
-        return SIREN_AUDIO_BASE64
+    if _volume_endpoint is None:
+        from ctypes import cast, POINTER
+        from comtypes import CLSCTX_ALL
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+        
+        devices = AudioUtilities.GetSpeakers()
+        interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+        _volume_endpoint = cast(interface, POINTER(IAudioEndpointVolume))
     
-    # Блокируем для загрузки
-    with _siren_audio_lock:
-        # Повторная проверка после получения блокировки
-        if SIREN_AUDIO_BASE64 is not None:
-            return SIREN_AUDIO_BASE64
-        
-        # Путь к файлу сирены
-        siren_path = Path(__file__).parent.parent.parent / "siren.wav"
-        
-        try:
-            if siren_path.exists():
-                with open(siren_path, 'rb') as f:
-                    SIREN_AUDIO_BASE64 = base64.b64encode(f.read()).decode('utf-8')
-                    logger.info(f"Siren audio loaded from {siren_path}")
-            else:
-                logger.warning(f"Siren audio file not found: {siren_path}")
-                SIREN_AUDIO_BASE64 = ""
-        except (IOError, OSError, PermissionError) as e:
-            logger.error(f"Error loading siren audio: {e}", exc_info=True)
-            SIREN_AUDIO_BASE64 = ""
-        except Exception as e:
-            logger.critical(f"Unexpected error loading siren audio: {e}", exc_info=True)
-            SIREN_AUDIO_BASE64 = ""
-        
-        return SIREN_AUDIO_BASE64
+    return _volume_endpoint
 
 
 class RedAlertLockScreen(QMainWindow):
@@ -80,17 +68,46 @@ class RedAlertLockScreen(QMainWindow):
     
     unlocked = pyqtSignal()  # Сигнал разблокировки администратором
     
+    # Общие шрифты надписей (создаются один раз, когда уже есть QApplication)
+    _TITLE_FONT = None
+    _MESSAGE_FONT = None
+    _REASON_FONT = None
+    _INFO_FONT = None
+    _HINT_FONT = None
+    
+    @classmethod
+    def _ensure_fonts(cls):
+        """Ленивое создание общих шрифтов экрана тревоги"""
+        if cls._TITLE_FONT is not None:
+            return
+        
+        def make_font(point_size: int, bold: bool = False) -> QFont:
+            font = QFont()
+            font.setPointSize(point_size)
+            font.setBold(bold)
+            return font
+        
+        cls._TITLE_FONT = make_font(80, bold=True)
+        cls._MESSAGE_FONT = make_font(48, bold=True)
+        cls._REASON_FONT = make_font(28)
+        cls._INFO_FONT = make_font(24, bold=True)
+        cls._HINT_FONT = make_font(12)
+    
     def __init__(self, reason: str = "Обнаружена попытка установки программы", alert_volume: int = 80, config=None):
         super().__init__()
         self.reason = reason
         self.alert_volume = alert_volume
-        self.media_player = None
-        self.audio_output = None
+        self.sound_effect = None
+        self._pwd_dialog = None
+        self._pwd_input = None
+        self.winsound_playing = False
         self.config = config
         
         # Счетчик кликов для ввода пароля (triple-click в углу)
         self.corner_clicks = 0
-        self.last_click_time = None
+        self.last_click_time = 0.0  # time.monotonic() последнего клика
+        # Левая граница зоны клика в правом верхнем углу (обновляется в resizeEvent)
+        self._corner_x_min = 0
         
         self.init_ui()
         self.setup_fullscreen()
@@ -100,20 +117,26 @@ class RedAlertLockScreen(QMainWindow):
     def init_ui(self):
         """Инициализация интерфейса"""
         self.setWindowTitle("LibLocker - ТРЕВОГА")
+        self._ensure_fonts()
         
         # Центральный виджет
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
+        # Слой мигания (яркий красный) под надписями, вне layout
+        self.blink_layer = QWidget(central_widget)
+        blink_palette = self.blink_layer.palette()
+        blink_palette.setColor(QPalette.ColorRole.Window, QColor(255, 0, 0))  # Более яркий красный
+        self.blink_layer.setPalette(blink_palette)
+        self.blink_layer.setAutoFillBackground(True)
+        self.blink_layer.lower()
+        
         layout = QVBoxLayout(central_widget)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Заголовок тревоги
         title_label = QLabel("⚠️ ТРЕВОГА ⚠️")
-        title_font = QFont()
-        title_font.setPointSize(80)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(self._TITLE_FONT)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
@@ -121,10 +144,7 @@ class RedAlertLockScreen(QMainWindow):
         
         # Главное сообщение
         message_label = QLabel("ОБНАРУЖЕНА ПОПЫТКА\nУСТАНОВКИ ПРОГРАММЫ")
-        message_font = QFont()
-        message_font.setPointSize(48)
-        message_font.setBold(True)
-        message_label.setFont(message_font)
+        message_label.setFont(self._MESSAGE_FONT)
         message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(message_label)
         
@@ -132,9 +152,7 @@ class RedAlertLockScreen(QMainWindow):
         
         # Причина
         reason_label = QLabel(self.reason)
-        reason_font = QFont()
-        reason_font.setPointSize(28)
-        reason_label.setFont(reason_font)
+        reason_label.setFont(self._REASON_FONT)
         reason_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(reason_label)
         
@@ -142,10 +160,7 @@ class RedAlertLockScreen(QMainWindow):
         
         # Инструкция
         info_label = QLabel("Компьютер заблокирован!\n\nОбратитесь к администратору немедленно")
-        info_font = QFont()
-        info_font.setPointSize(24)
-        info_font.setBold(True)
-        info_label.setFont(info_font)
+        info_label.setFont(self._INFO_FONT)
         info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(info_label)
         
@@ -153,9 +168,7 @@ class RedAlertLockScreen(QMainWindow):
         
         # Подсказка для админа
         hint_label = QLabel("(Администратор: тройной клик в правом верхнем углу)")
-        hint_font = QFont()
-        hint_font.setPointSize(12)
-        hint_label.setFont(hint_font)
+        hint_label.setFont(self._HINT_FONT)
         hint_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         hint_label.setStyleSheet("color: #FFB6C1;")  # Светло-розовый для читабельности на красном
         layout.addWidget(hint_label)
@@ -167,21 +180,39 @@ class RedAlertLockScreen(QMainWindow):
         self.setPalette(palette)
         self.setAutoFillBackground(True)
         
-        # Эффект мигания
-        self.blink_timer = QTimer()
-        self.blink_timer.timeout.connect(self.toggle_blink)
-        self.blink_timer.start(500)  # Мигание каждые 500 мс
-        self.blink_state = False
+        # Эффект мигания: анимация прозрачности слоя выполняется внутри Qt,
+        # без Python-обработчика на каждое переключение
+        self.blink_effect = QGraphicsOpacityEffect(self.blink_layer)
+        self.blink_effect.setOpacity(0.0)
+        self.blink_layer.setGraphicsEffect(self.blink_effect)
+        
+        self.blink_animation = QPropertyAnimation(self.blink_effect, b"opacity", self)
+        self.blink_animation.setDuration(1000)  # Мигание каждые 500 мс
+        self.blink_animation.setKeyValueAt(0.0, 0.0)
+        self.blink_animation.setKeyValueAt(0.499, 0.0)
+        self.blink_animation.setKeyValueAt(0.5, 1.0)
+        self.blink_animation.setKeyValueAt(0.999, 1.0)
+        self.blink_animation.setKeyValueAt(1.0, 0.0)
+        self.blink_animation.setLoopCount(-1)
+        self.blink_animation.start()
     
-    def toggle_blink(self):
-        """Переключение мигания экрана"""
-        self.blink_state = not self.blink_state
-        palette = self.palette()
-        if self.blink_state:
-            palette.setColor(QPalette.ColorRole.Window, QColor(255, 0, 0))  # Более яркий красный
-        else:
-            palette.setColor(QPalette.ColorRole.Window, QColor(200, 0, 0))  # Темнее
-        self.setPalette(palette)
+    def resizeEvent(self, event):
+        """Растягиваем слой мигания на всё окно и пересчитываем зону клика"""
+        super().resizeEvent(event)
+        self.blink_layer.setGeometry(self.centralWidget().rect())
+        self._corner_x_min = self.width() - self.CORNER_CLICK_ZONE_SIZE
+    
+    def showEvent(self, event):
+        """Возобновляем мигание, когда окно снова видно"""
+        super().showEvent(event)
+        if self.blink_animation and self.blink_animation.state() == QAbstractAnimation.State.Paused:
+            self.blink_animation.resume()
+    
+    def hideEvent(self, event):
+        """Приостанавливаем мигание, пока окно скрыто"""
+        super().hideEvent(event)
+        if self.blink_animation and self.blink_animation.state() == QAbstractAnimation.State.Running:
+            self.blink_animation.pause()
     
     def setup_fullscreen(self):
         """Настройка полноэкранного режима"""
@@ -202,29 +233,15 @@ class RedAlertLockScreen(QMainWindow):
             return
         
         try:
-            # Создаем временный файл для аудио
-            load_siren_audio()
-            
-            if SIREN_AUDIO_BASE64:
-                # Декодируем base64 в временный файл
-                import tempfile
-                temp_dir = tempfile.gettempdir()
-                temp_audio_path = os.path.join(temp_dir, "liblocker_siren.wav")
-                
-                with open(temp_audio_path, 'wb') as f:
-                    f.write(base64.b64decode(SIREN_AUDIO_BASE64))
-                
-                # Создаем плеер
-                self.audio_output = QAudioOutput()
-                self.media_player = QMediaPlayer()
-                self.media_player.setAudioOutput(self.audio_output)
+            if _SIREN_PATH:
+                # QSoundEffect декодирует WAV один раз и зацикливает его в аудио-потоке
+                self.sound_effect = QSoundEffect()
+                self.sound_effect.setSource(QUrl.fromLocalFile(_SIREN_PATH))
+                self.sound_effect.setLoopCount(QSoundEffect.Loop.Infinite.value)
                 
                 # Устанавливаем громкость (0.0 - 1.0)
                 volume = self.alert_volume / 100.0
-                self.audio_output.setVolume(volume)
-                
-                # Загружаем файл
-                self.media_player.setSource(QUrl.fromLocalFile(temp_audio_path))
+                self.sound_effect.setVolume(volume)
                 
                 logger.info(f"Audio player setup complete, volume: {volume}")
             else:
@@ -238,51 +255,40 @@ class RedAlertLockScreen(QMainWindow):
         try:
             # Устанавливаем системную громкость (Windows)
             if sys.platform == 'win32':
+                global _volume_endpoint
                 try:
-                    from ctypes import cast, POINTER
-                    from comtypes import CLSCTX_ALL
-                    from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-                    
-                    devices = AudioUtilities.GetSpeakers()
-                    interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-                    volume = cast(interface, POINTER(IAudioEndpointVolume))
-                    
                     # Устанавливаем системную громкость
-                    volume.SetMasterVolumeLevelScalar(self.alert_volume / 100.0, None)
+                    _get_volume_endpoint().SetMasterVolumeLevelScalar(self.alert_volume / 100.0, None)
                     logger.info(f"System volume set to {self.alert_volume}%")
                 except Exception as e:
+                    # Устройство могло смениться - при следующей тревоге получим интерфейс заново
+                    _volume_endpoint = None
                     logger.warning(f"Could not set system volume: {e}")
             
             # Воспроизводим звук
-            if MULTIMEDIA_AVAILABLE and self.media_player:
-                # Зацикливаем воспроизведение
-                self.media_player.mediaStatusChanged.connect(self._on_media_status_changed)
-                self.media_player.play()
+            if MULTIMEDIA_AVAILABLE and self.sound_effect:
+                self.sound_effect.play()
                 logger.info("Siren started playing (PyQt6.QtMultimedia)")
-            elif WINSOUND_AVAILABLE:
-                # Fallback to winsound
-                logger.info("Using winsound for alert")
-                # Play system sound repeatedly in a timer
-                self.sound_timer = QTimer()
-                self.sound_timer.timeout.connect(lambda: winsound.MessageBeep(winsound.MB_ICONEXCLAMATION))
-                self.sound_timer.start(500)
             else:
-                logger.warning("No audio playback available")
+                self._start_fallback_sound()
         
         except Exception as e:
             logger.error(f"Error starting siren: {e}", exc_info=True)
     
-    def _on_media_status_changed(self, status):
-        """Обработка изменения статуса медиа для зацикливания"""
-        if not MULTIMEDIA_AVAILABLE:
-            return
-        
-        from PyQt6.QtMultimedia import QMediaPlayer
-        
-        if status == QMediaPlayer.MediaStatus.EndOfMedia:
-            # Перезапускаем воспроизведение
-            self.media_player.setPosition(0)
-            self.media_player.play()
+    def _start_fallback_sound(self):
+        """Запасной звук тревоги, если QtMultimedia недоступен"""
+        if WINSOUND_AVAILABLE:
+            # Fallback to winsound
+            logger.info("Using winsound for alert")
+            # Зацикливание выполняет системный микшер (SND_ASYNC не блокирует поток интерфейса)
+            flags = winsound.SND_LOOP | winsound.SND_ASYNC
+            if _SIREN_PATH:
+                winsound.PlaySound(_SIREN_PATH, flags | winsound.SND_FILENAME)
+            else:
+                winsound.PlaySound("SystemExclamation", flags | winsound.SND_ALIAS)
+            self.winsound_playing = True
+        else:
+            logger.warning("No audio playback available")
     
     def keyPressEvent(self, event):
         """Блокировка нажатий клавиш"""
@@ -291,28 +297,41 @@ class RedAlertLockScreen(QMainWindow):
     
     def mousePressEvent(self, event):
         """Обработка кликов мыши для показа поля пароля"""
-        # Клик в правом верхнем углу
-        if event.pos().x() > self.width() - self.CORNER_CLICK_ZONE_SIZE and event.pos().y() < self.CORNER_CLICK_ZONE_SIZE:
-            current_time = datetime.now()
-            
-            # Проверка тройного клика (в течение заданного времени)
-            if self.last_click_time and (current_time - self.last_click_time).total_seconds() < self.TRIPLE_CLICK_TIMEOUT:
-                self.corner_clicks += 1
-            else:
-                self.corner_clicks = 1
-            
-            self.last_click_time = current_time
-            
-            # Если 3 клика - показываем поле пароля
-            if self.corner_clicks >= 3:
-                self.show_password_dialog()
-                self.corner_clicks = 0
-        else:
+        # Почти все клики приходятся вне угла - отсекаем их самой дешевой проверкой
+        pos = event.pos()
+        if pos.y() >= self.CORNER_CLICK_ZONE_SIZE or pos.x() <= self._corner_x_min:
             # Блокируем все другие клики
             event.ignore()
+            return
+        
+        # Клик в правом верхнем углу
+        current_time = time.monotonic()
+        
+        # Проверка тройного клика (в течение заданного времени)
+        if current_time - self.last_click_time < self.TRIPLE_CLICK_TIMEOUT:
+            self.corner_clicks += 1
+        else:
+            self.corner_clicks = 1
+        
+        self.last_click_time = current_time
+        
+        # Если 3 клика - показываем поле пароля
+        if self.corner_clicks >= 3:
+            self.show_password_dialog()
+            self.corner_clicks = 0
     
     def show_password_dialog(self):
         """Показать диалог ввода пароля администратора"""
+        # Диалог создается один раз и переиспользуется при повторных попытках
+        if self._pwd_dialog is None:
+            self._build_password_dialog()
+        
+        self._pwd_input.clear()
+        self._pwd_input.setFocus()
+        self._pwd_dialog.exec()
+    
+    def _build_password_dialog(self):
+        """Создание диалога ввода пароля"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Разблокировка")
         dialog.setModal(True)
@@ -336,44 +355,40 @@ class RedAlertLockScreen(QMainWindow):
         
         dialog.setLayout(layout)
         
-        def check_password():
-            password = password_input.text()
-            
-            # Если config не передан или пароль не установлен
-            if not self.config or not self.config.admin_password_hash:
-                QMessageBox.warning(
-                    dialog,
-                    "Предупреждение",
-                    "Пароль администратора не установлен!\nОбратитесь к администратору для настройки безопасности."
-                )
-                dialog.accept()
-                self.unlocked.emit()
-                return
-            
-            # Проверяем пароль через verify_password
-            if verify_password(password, self.config.admin_password_hash):
-                QMessageBox.information(dialog, "Успех", "Разблокировка выполнена")
-                dialog.accept()
-                self.unlocked.emit()
-            else:
-                QMessageBox.warning(dialog, "Ошибка", "Неверный пароль")
-        
-        btn_ok.clicked.connect(check_password)
+        btn_ok.clicked.connect(self._check_password)
         btn_cancel.clicked.connect(dialog.reject)
         
-        dialog.exec()
+        self._pwd_dialog = dialog
+        self._pwd_input = password_input
+    
+    def _check_password(self):
+        """Проверка введенного пароля администратора"""
+        dialog = self._pwd_dialog
+        password = self._pwd_input.text()
+        
+        # Если config не передан или пароль не установлен
+        if not self.config or not self.config.admin_password_hash:
+            QMessageBox.warning(
+                dialog,
+                "Предупреждение",
+                "Пароль администратора не установлен!\nОбратитесь к администратору для настройки безопасности."
+            )
+            dialog.accept()
+            self.unlocked.emit()
+            return
+        
+        # Проверяем пароль через verify_password
+        if verify_password(password, self.config.admin_password_hash):
+            QMessageBox.information(dialog, "Успех", "Разблокировка выполнена")
+            dialog.accept()
+            self.unlocked.emit()
+        else:
+            QMessageBox.warning(dialog, "Ошибка", "Неверный пароль")
     
     def closeEvent(self, event):
         """Блокировка закрытия окна"""
         # Останавливаем аудио при закрытии
-        if MULTIMEDIA_AVAILABLE and self.media_player:
-            self.media_player.stop()
-        
-        if hasattr(self, 'sound_timer') and self.sound_timer:
-            self.sound_timer.stop()
-        
-        if self.blink_timer:
-            self.blink_timer.stop()
+        self._stop_alert()
         
         # Окно может быть закрыто только программно или по паролю
         if not hasattr(self, '_allow_close'):
@@ -381,7 +396,32 @@ class RedAlertLockScreen(QMainWindow):
         else:
             event.accept()
     
+    def _stop_alert(self):
+        """Остановка сирены и мигания"""
+        if MULTIMEDIA_AVAILABLE and self.sound_effect:
+            self.sound_effect.stop()
+        
+        if self.winsound_playing:
+            winsound.PlaySound(None, 0)
+            self.winsound_playing = False
+        
+        if self.blink_animation:
+            self.blink_animation.stop()
+    
     def force_close(self):
         """Принудительное закрытие окна"""
+        self._stop_alert()
+        
+        # Освобождаем звук и анимацию до уничтожения окна
+        if MULTIMEDIA_AVAILABLE and self.sound_effect:
+            self.sound_effect.setSource(QUrl())
+            self.sound_effect.deleteLater()
+            self.sound_effect = None
+        
+        if self.blink_animation:
+            self.blink_animation.deleteLater()
+            self.blink_animation = None
+        
         self._allow_close = True
         self.close()
+
@@ -7,17 +7,22 @@ import asyncio
 import logging
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QTableWidget, QTableWidgetItem, QLabel, QDialog,
+    QPushButton, QTableView, QLabel, QDialog,
     QSpinBox, QDoubleSpinBox, QCheckBox, QLineEdit, QMessageBox,
     QTabWidget, QGroupBox, QFormLayout, QHeaderView, QDateEdit, QComboBox,
     QInputDialog, QMenu
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QDate
-from PyQt6.QtGui import QIcon, QColor, QAction
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSignal, QDate, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import QIcon, QColor, QAction, QBrush
 import qasync
+from sqlalchemy import case, func
 
 from .server import LibLockerServer
 from ..shared.database import Database, ClientModel, SessionModel
@@ -31,6 +36,15 @@ logger = logging.getLogger(__name__)
 MIN_PASSWORD_LENGTH = 8
 RECOMMENDED_PASSWORD_LENGTH = 8
 ASYNC_OPERATION_TIMEOUT = 5.0  # Timeout in seconds for async operations
+CLIENTS_REFRESH_MIN_MS = 1000  # Период обновления таблицы клиентов после изменений
+CLIENTS_REFRESH_MAX_MS = 10000  # Предельный период, когда ничего не меняется
+CLIENT_EVENTS_COALESCE_MS = 150  # Окно объединения уведомлений сервера об изменении клиентов
+PASSWORD_CHECK_DELAY_MS = 150  # Задержка проверки надежности пароля после ввода
+CLIENT_SESSIONS_PAGE_SIZE = 200  # Сессий на странице детальной статистики клиента
+SESSIONS_EXPORT_BATCH_SIZE = 1000  # Порция строк при чтении сессий для экспорта в PDF
+STATUS_MESSAGE_TIMEOUT_MS = 3000  # Время показа подтверждений в строке состояния
+SESSION_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'  # Формат времени в таблице сессий (strftime SQLite)
+SESSION_ACTIVE_TEXT = "Активна"  # Окончание еще не завершенной сессии
 
 # Messages
 UNLOCK_CONFIRMATION_MESSAGE = (
@@ -38,9 +52,9 @@ UNLOCK_CONFIRMATION_MESSAGE = (
     "Это снимет блокировку с красного экрана тревоги и экрана конца сессии."
 )
 
-# Button styles
+# Стили кнопок (кнопка выбирает стиль через objectName)
 BUTTON_STYLE_PRIMARY = """
-    QPushButton {
+    QPushButton#primary {
         background-color: #4CAF50;
         color: white;
         border: none;
@@ -48,16 +62,16 @@ BUTTON_STYLE_PRIMARY = """
         font-weight: bold;
         font-size: 14px;
     }
-    QPushButton:hover {
+    QPushButton#primary:hover {
         background-color: #45a049;
     }
-    QPushButton:pressed {
+    QPushButton#primary:pressed {
         background-color: #3d8b40;
     }
 """
 
 BUTTON_STYLE_DANGER = """
-    QPushButton {
+    QPushButton#danger {
         background-color: #f44336;
         color: white;
         border: none;
@@ -65,16 +79,16 @@ BUTTON_STYLE_DANGER = """
         font-weight: bold;
         font-size: 14px;
     }
-    QPushButton:hover {
+    QPushButton#danger:hover {
         background-color: #da190b;
     }
-    QPushButton:pressed {
+    QPushButton#danger:pressed {
         background-color: #c1160a;
     }
 """
 
 BUTTON_STYLE_WARNING = """
-    QPushButton {
+    QPushButton#warning {
         background-color: #ff9800;
         color: white;
         border: none;
@@ -82,16 +96,16 @@ BUTTON_STYLE_WARNING = """
         font-weight: bold;
         font-size: 14px;
     }
-    QPushButton:hover {
+    QPushButton#warning:hover {
         background-color: #e68900;
     }
-    QPushButton:pressed {
+    QPushButton#warning:pressed {
         background-color: #cc7a00;
     }
 """
 
 BUTTON_STYLE_INFO = """
-    QPushButton {
+    QPushButton#info {
         background-color: #2196F3;
         color: white;
         border: none;
@@ -99,16 +113,16 @@ BUTTON_STYLE_INFO = """
         font-weight: bold;
         font-size: 14px;
     }
-    QPushButton:hover {
+    QPushButton#info:hover {
         background-color: #1976D2;
     }
-    QPushButton:pressed {
+    QPushButton#info:pressed {
         background-color: #1565C0;
     }
 """
 
 BUTTON_STYLE_SECONDARY = """
-    QPushButton {
+    QPushButton#secondary {
         background-color: #757575;
         color: white;
         border: none;
@@ -116,16 +130,16 @@ BUTTON_STYLE_SECONDARY = """
         font-weight: bold;
         font-size: 14px;
     }
-    QPushButton:hover {
+    QPushButton#secondary:hover {
         background-color: #616161;
     }
-    QPushButton:pressed {
+    QPushButton#secondary:pressed {
         background-color: #424242;
     }
 """
 
 BUTTON_STYLE_PURPLE = """
-    QPushButton {
+    QPushButton#purple {
         background-color: #9C27B0;
         color: white;
         border: none;
@@ -133,20 +147,20 @@ BUTTON_STYLE_PURPLE = """
         font-weight: bold;
         font-size: 14px;
     }
-    QPushButton:hover {
+    QPushButton#purple:hover {
         background-color: #7B1FA2;
     }
-    QPushButton:pressed {
+    QPushButton#purple:pressed {
         background-color: #6A1B9A;
     }
 """
 
 TABLE_STYLE = """
-    QTableWidget {
+    QTableView {
         gridline-color: #d0d0d0;
         background-color: white;
     }
-    QTableWidget::item:selected {
+    QTableView::item:selected {
         background-color: #0078d7;
         color: white;
     }
@@ -158,10 +172,39 @@ TABLE_STYLE = """
     }
 """
 
+LABEL_STYLE_HEADERS = """
+    QLabel#header {
+        font-size: 16px;
+        font-weight: bold;
+        padding: 10px;
+    }
+    QLabel#subheader {
+        font-size: 14px;
+        font-weight: bold;
+        padding: 10px;
+    }
+"""
+
+# Стили меняющихся по состоянию надписей
+LABEL_STYLE_HINT = "color: gray; font-style: italic;"
+LABEL_STYLE_GOOD = "color: green; font-weight: bold;"
+LABEL_STYLE_FAIR = "color: orange; font-weight: bold;"
+LABEL_STYLE_BAD = "color: red; font-weight: bold;"
+
+# Таблица стилей приложения: разбирается один раз и применяется ко всем окнам
+APP_STYLE = "".join([
+    BUTTON_STYLE_PRIMARY, BUTTON_STYLE_DANGER, BUTTON_STYLE_WARNING, BUTTON_STYLE_INFO,
+    BUTTON_STYLE_SECONDARY, BUTTON_STYLE_PURPLE, TABLE_STYLE, LABEL_STYLE_HEADERS
+])
+
 
+@lru_cache(maxsize=None)
 def register_russian_fonts():
     """Регистрирует шрифты с поддержкой кириллицы для PDF экспорта
     
+    Разбор TTF файлов выполняется один раз за запуск,
+    повторные экспорты получают уже зарегистрированные имена шрифтов.
+    
     Returns:
         tuple: (font_name, font_name_bold) - имена зарегистрированных шрифтов
     """
@@ -215,19 +258,175 @@ def register_russian_fonts():
     return ('Helvetica', 'Helvetica-Bold')
 
 
-class ServerThread(QThread):
-    """Поток для запуска WebSocket сервера"""
+class DbFetchSignals(QObject):
+    """Сигналы фоновой выборки из БД"""
+    done = pyqtSignal(object)
+
+
+class DbFetch(QRunnable):
+    """Выборка из БД в пуле потоков
+
+    fetch выполняется в рабочем потоке со своей сессией БД,
+    результат (или None при ошибке) передается в GUI сигналом done.
+    """
 
-    def __init__(self, server: LibLockerServer):
+    def __init__(self, fetch):
         super().__init__()
-        self.server = server
-        self.loop = None
+        self.fetch = fetch
+        self.signals = DbFetchSignals()
 
     def run(self):
-        """Запуск сервера в отдельном потоке"""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        self.loop.run_until_complete(self.server.run())
+        try:
+            result = self.fetch()
+        except Exception as e:
+            logger.error(f"Error fetching data from database: {e}")
+            result = None
+        self.signals.done.emit(result)
+
+
+class RowsTableModel(QAbstractTableModel):
+    """Модель таблицы, читающая ячейки напрямую из списка кортежей"""
+
+    def __init__(self, headers: List[str], parent=None):
+        super().__init__(parent)
+        self.headers = headers
+        self.rows: List[tuple] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            values = self.rows[index.row()]
+            col = index.column()
+            if col < len(values):
+                return str(values[col])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+    def set_rows(self, rows: List[tuple]) -> bool:
+        """
+        Заменить содержимое модели
+
+        Сообщает представлению только об изменившихся строках,
+        поэтому выделение и прокрутка сохраняются между обновлениями.
+
+        Returns:
+            bool: True если содержимое изменилось
+        """
+        old_count = len(self.rows)
+        new_count = len(rows)
+        changed = old_count != new_count
+
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            del self.rows[new_count:]
+            self.endRemoveRows()
+
+        last_col = len(self.headers) - 1
+        for row in range(min(old_count, new_count)):
+            if self.rows[row] != rows[row]:
+                self.rows[row] = rows[row]
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_col))
+                changed = True
+
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self.rows.extend(rows[old_count:])
+            self.endInsertRows()
+
+        return changed
+
+    def update_rows(self, changes: dict):
+        """
+        Заменить отдельные строки модели
+
+        Представление получает одно уведомление dataChanged,
+        охватывающее все изменившиеся строки.
+
+        Args:
+            changes: {номер строки: новые значения}
+        """
+        changed_rows = []
+        for row, values in changes.items():
+            if self.rows[row] != values:
+                self.rows[row] = values
+                changed_rows.append(row)
+
+        if changed_rows:
+            self.dataChanged.emit(
+                self.index(min(changed_rows), 0),
+                self.index(max(changed_rows), len(self.headers) - 1)
+            )
+
+
+class ClientsTableModel(RowsTableModel):
+    """Модель таблицы клиентов: (id, имя, IP, статус, время сессии)"""
+
+    STATUS_COLUMN = 3
+
+    # Цвета статусов клиентов
+    COLOR_ONLINE = QColor(144, 238, 144)  # Светло-зеленый
+    COLOR_IN_SESSION = QColor(173, 216, 230)  # Светло-голубой
+    COLOR_OFFLINE = QColor(211, 211, 211)  # Светло-серый
+    # Кисти фона создаются один раз: представление получает готовую кисть без преобразования цвета
+    STATUS_BRUSHES = {
+        "Онлайн": QBrush(COLOR_ONLINE),
+        "В сессии": QBrush(COLOR_IN_SESSION),
+        "Оффлайн": QBrush(COLOR_OFFLINE),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(["ID", "Имя", "IP", "Статус", "Время сессии", "Действия"], parent)
+        self._row_index = {}
+
+    def set_rows(self, rows: List[tuple]) -> bool:
+        changed = super().set_rows(rows)
+        if changed:
+            self._row_index = {values[0]: row for row, values in enumerate(rows)}
+        return changed
+
+    def row_of(self, client_id: int):
+        """Номер строки клиента или None"""
+        return self._row_index.get(client_id)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if index.column() == self.STATUS_COLUMN:
+                return self.STATUS_BRUSHES.get(self.rows[index.row()][self.STATUS_COLUMN])
+            return None
+        return super().data(index, role)
+
+    def client_id(self, row: int) -> int:
+        """ID клиента в строке"""
+        return self.rows[row][0]
+
+    def client_name(self, row: int) -> str:
+        """Имя клиента в строке"""
+        return self.rows[row][1]
+
+
+class ClientStatsTableModel(RowsTableModel):
+    """Модель таблицы статистики по клиентам
+
+    ID клиента хранится последним элементом строки и не отображается.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__([
+            "Клиент", "Всего сессий", "Активных", "Общее время (мин)", "Средн. время (мин)", "Средн. стоимость", "Общая стоимость (руб)"
+        ], parent)
+
+    def client_id(self, row: int) -> int:
+        """ID клиента в строке"""
+        return self.rows[row][-1]
 
 
 class SessionDialog(QDialog):
@@ -246,7 +445,7 @@ class SessionDialog(QDialog):
 
         # Заголовок
         header = QLabel("Выберите длительность сессии")
-        header.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        header.setObjectName("subheader")
         layout.addWidget(header)
 
         # Быстрые кнопки
@@ -255,12 +454,12 @@ class SessionDialog(QDialog):
         
         self.btn_30min = QPushButton("⏱️ +30 минут")
         self.btn_30min.setMinimumHeight(50)
-        self.btn_30min.setStyleSheet(BUTTON_STYLE_INFO)
+        self.btn_30min.setObjectName("info")
         quick_buttons.addWidget(self.btn_30min)
         
         self.btn_unlimited = QPushButton("♾️ Безлимит")
         self.btn_unlimited.setMinimumHeight(50)
-        self.btn_unlimited.setStyleSheet(BUTTON_STYLE_PURPLE)
+        self.btn_unlimited.setObjectName("purple")
         quick_buttons.addWidget(self.btn_unlimited)
         
         quick_group.setLayout(quick_buttons)
@@ -288,12 +487,12 @@ class SessionDialog(QDialog):
         
         self.btn_ok = QPushButton("✅ Создать")
         self.btn_ok.setMinimumHeight(40)
-        self.btn_ok.setStyleSheet(BUTTON_STYLE_PRIMARY)
+        self.btn_ok.setObjectName("primary")
         buttons.addWidget(self.btn_ok)
         
         self.btn_cancel = QPushButton("❌ Отмена")
         self.btn_cancel.setMinimumHeight(40)
-        self.btn_cancel.setStyleSheet(BUTTON_STYLE_SECONDARY)
+        self.btn_cancel.setObjectName("secondary")
         buttons.addWidget(self.btn_cancel)
         
         layout.addLayout(buttons)
@@ -339,6 +538,12 @@ class SessionDialog(QDialog):
         self.minutes_spin.setValue(total_minutes)
         self.is_unlimited = False
 
+    def reset(self):
+        """Сбросить выбор перед повторным показом диалога"""
+        self.is_unlimited = False
+        self.hours_spin.setValue(0)
+        self.minutes_spin.setValue(0)
+
     def set_unlimited(self):
         """Установить безлимит"""
         self.is_unlimited = True
@@ -356,13 +561,28 @@ class SessionDialog(QDialog):
 class DetailedClientStatisticsDialog(QDialog):
     """Диалог детальной статистики по клиенту"""
 
+    # Сессии клиента удалены (очистка может завершиться уже после закрытия диалога)
+    sessions_cleared = pyqtSignal()
+
     def __init__(self, client: ClientModel, db: Database, parent=None):
         super().__init__(parent)
         self.client = client
+        self.client_id = client.id
         self.db = db
         self.setWindowTitle(f"Статистика клиента: {client.name}")
         self.setModal(True)
         self.setMinimumSize(900, 600)
+        self.page = 0
+
+        # Запросы к БД и построение PDF идут в пуле потоков; ссылки на задачи
+        # держат их сигналы живыми, повторное обновление откладывается до завершения текущего
+        self._stats_fetch = None
+        self._stats_fetch_pending = False
+        self._export_fetch = None
+        self._clear_fetch = None
+        # После закрытия диалога результаты фоновых задач отбрасываются
+        self._closed = False
+
         self.init_ui()
         self.update_statistics()
 
@@ -372,7 +592,7 @@ class DetailedClientStatisticsDialog(QDialog):
 
         # Заголовок с информацией о клиенте
         header = QLabel(f"📊 Детальная статистика: {self.client.name}")
-        header.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px;")
+        header.setObjectName("header")
         layout.addWidget(header)
 
         # Фильтры
@@ -392,7 +612,7 @@ class DetailedClientStatisticsDialog(QDialog):
         self.start_date.setCalendarPopup(True)
         self.start_date.setDate(QDate.currentDate().addMonths(-1))
         self.start_date.setEnabled(False)
-        self.start_date.dateChanged.connect(self.update_statistics)
+        self.start_date.dateChanged.connect(self.apply_filter)
         filter_layout.addWidget(self.start_date)
 
         filter_layout.addWidget(QLabel("До:"))
@@ -400,15 +620,15 @@ class DetailedClientStatisticsDialog(QDialog):
         self.end_date.setCalendarPopup(True)
         self.end_date.setDate(QDate.currentDate())
         self.end_date.setEnabled(False)
-        self.end_date.dateChanged.connect(self.update_statistics)
+        self.end_date.dateChanged.connect(self.apply_filter)
         filter_layout.addWidget(self.end_date)
 
         filter_layout.addStretch()
 
         # Кнопка применить фильтр
         btn_apply_filter = QPushButton("🔍 Применить")
-        btn_apply_filter.clicked.connect(self.update_statistics)
-        btn_apply_filter.setStyleSheet(BUTTON_STYLE_INFO)
+        btn_apply_filter.clicked.connect(self.apply_filter)
+        btn_apply_filter.setObjectName("info")
         filter_layout.addWidget(btn_apply_filter)
 
         filter_group.setLayout(filter_layout)
@@ -421,15 +641,15 @@ class DetailedClientStatisticsDialog(QDialog):
         # Первая строка метрик
         summary_row1 = QHBoxLayout()
         self.total_sessions_label = QLabel("Сессий: 0")
-        self.total_sessions_label.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        self.total_sessions_label.setObjectName("subheader")
         summary_row1.addWidget(self.total_sessions_label)
 
         self.active_sessions_label = QLabel("Активных: 0")
-        self.active_sessions_label.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        self.active_sessions_label.setObjectName("subheader")
         summary_row1.addWidget(self.active_sessions_label)
 
         self.completed_sessions_label = QLabel("Завершенных: 0")
-        self.completed_sessions_label.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        self.completed_sessions_label.setObjectName("subheader")
         summary_row1.addWidget(self.completed_sessions_label)
         summary_row1.addStretch()
         summary_layout.addLayout(summary_row1)
@@ -437,11 +657,11 @@ class DetailedClientStatisticsDialog(QDialog):
         # Вторая строка метрик
         summary_row2 = QHBoxLayout()
         self.total_time_label = QLabel("Общее время: 0 мин")
-        self.total_time_label.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        self.total_time_label.setObjectName("subheader")
         summary_row2.addWidget(self.total_time_label)
 
         self.avg_time_label = QLabel("Средн. время: 0 мин")
-        self.avg_time_label.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        self.avg_time_label.setObjectName("subheader")
         summary_row2.addWidget(self.avg_time_label)
         summary_row2.addStretch()
         summary_layout.addLayout(summary_row2)
@@ -449,11 +669,11 @@ class DetailedClientStatisticsDialog(QDialog):
         # Третья строка метрик
         summary_row3 = QHBoxLayout()
         self.total_cost_label = QLabel("Общая стоимость: 0.00 руб")
-        self.total_cost_label.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        self.total_cost_label.setObjectName("subheader")
         summary_row3.addWidget(self.total_cost_label)
 
         self.avg_cost_label = QLabel("Средн. стоимость: 0.00 руб")
-        self.avg_cost_label.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        self.avg_cost_label.setObjectName("subheader")
         summary_row3.addWidget(self.avg_cost_label)
         summary_row3.addStretch()
         summary_layout.addLayout(summary_row3)
@@ -462,39 +682,56 @@ class DetailedClientStatisticsDialog(QDialog):
         layout.addWidget(summary_group)
 
         # Таблица сессий
-        self.sessions_table = QTableWidget()
-        self.sessions_table.setColumnCount(5)
-        self.sessions_table.setHorizontalHeaderLabels([
-            "ID", "Начало", "Окончание", "Длительность (мин)", "Стоимость (руб)"
-        ])
+        self.sessions_model = RowsTableModel(
+            ["ID", "Начало", "Окончание", "Длительность (мин)", "Стоимость (руб)"], self
+        )
+        self.sessions_table = QTableView()
+        self.sessions_table.setModel(self.sessions_model)
         self.sessions_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.sessions_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.sessions_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.sessions_table.setAlternatingRowColors(True)
-        self.sessions_table.setStyleSheet(TABLE_STYLE)
         layout.addWidget(self.sessions_table)
 
+        # Переключение страниц таблицы сессий
+        pages_layout = QHBoxLayout()
+        pages_layout.addStretch()
+
+        self.btn_prev_page = QPushButton("◀ Назад")
+        self.btn_prev_page.clicked.connect(self.prev_page)
+        pages_layout.addWidget(self.btn_prev_page)
+
+        self.page_label = QLabel()
+        pages_layout.addWidget(self.page_label)
+
+        self.btn_next_page = QPushButton("Вперед ▶")
+        self.btn_next_page.clicked.connect(self.next_page)
+        pages_layout.addWidget(self.btn_next_page)
+
+        pages_layout.addStretch()
+        layout.addLayout(pages_layout)
+
         # Кнопки действий
         buttons_layout = QHBoxLayout()
 
-        btn_export = QPushButton("📄 Экспорт в PDF")
-        btn_export.clicked.connect(self.export_client_stats)
-        btn_export.setMinimumHeight(35)
-        btn_export.setMinimumWidth(200)
-        btn_export.setStyleSheet(BUTTON_STYLE_INFO)
-        buttons_layout.addWidget(btn_export)
+        self.btn_export = QPushButton("📄 Экспорт в PDF")
+        self.btn_export.clicked.connect(self.export_client_stats)
+        self.btn_export.setMinimumHeight(35)
+        self.btn_export.setMinimumWidth(200)
+        self.btn_export.setObjectName("info")
+        buttons_layout.addWidget(self.btn_export)
 
-        btn_clear = QPushButton("🗑️ Очистить статистику")
-        btn_clear.clicked.connect(self.clear_statistics)
-        btn_clear.setMinimumHeight(35)
-        btn_clear.setMinimumWidth(200)
-        btn_clear.setStyleSheet(BUTTON_STYLE_DANGER)
-        buttons_layout.addWidget(btn_clear)
+        self.btn_clear = QPushButton("🗑️ Очистить статистику")
+        self.btn_clear.clicked.connect(self.clear_statistics)
+        self.btn_clear.setMinimumHeight(35)
+        self.btn_clear.setMinimumWidth(200)
+        self.btn_clear.setObjectName("danger")
+        buttons_layout.addWidget(self.btn_clear)
 
         btn_close = QPushButton("✖️ Закрыть")
         btn_close.clicked.connect(self.accept)
         btn_close.setMinimumHeight(35)
         btn_close.setMinimumWidth(200)
-        btn_close.setStyleSheet(BUTTON_STYLE_SECONDARY)
+        btn_close.setObjectName("secondary")
         buttons_layout.addWidget(btn_close)
 
         buttons_layout.addStretch()
@@ -510,8 +747,24 @@ class DetailedClientStatisticsDialog(QDialog):
         self.end_date.setEnabled(custom_period)
         
         if not custom_period:
+            self.apply_filter()
+
+    def apply_filter(self):
+        """Применить фильтр: статистика за новый период с первой страницы"""
+        self.page = 0
+        self.update_statistics()
+
+    def prev_page(self):
+        """Предыдущая страница сессий"""
+        if self.page > 0:
+            self.page -= 1
             self.update_statistics()
 
+    def next_page(self):
+        """Следующая страница сессий"""
+        self.page += 1
+        self.update_statistics()
+
     def get_date_range(self):
         """Получить диапазон дат на основе выбранного фильтра"""
         period_index = self.period_combo.currentIndex()
@@ -541,76 +794,117 @@ class DetailedClientStatisticsDialog(QDialog):
         
         return None, None
 
+    def _filter_sessions(self, query, start_date, end_date):
+        """Ограничить запрос сессиями клиента за период"""
+        query = query.filter(SessionModel.client_id == self.client_id)
+
+        # Применяем фильтр по датам
+        if start_date:
+            query = query.filter(SessionModel.start_time >= start_date)
+        if end_date:
+            query = query.filter(SessionModel.start_time <= end_date)
+        return query
+
+    def _query_session_rows(self, db_session, start_date, end_date):
+        """Запрос сессий периода для таблицы, от новых к старым (только нужные колонки)"""
+        # Пустые длительность и стоимость заменяет SQLite
+        return self._filter_sessions(db_session.query(
+            SessionModel.id, SessionModel.start_time, SessionModel.end_time,
+            func.coalesce(SessionModel.actual_duration, 0),
+            func.coalesce(SessionModel.cost, 0.0)
+        ), start_date, end_date).order_by(SessionModel.start_time.desc())
+
+    @staticmethod
+    def _session_row(session) -> tuple:
+        """Строка таблицы сессий: (id, начало, окончание, длительность, стоимость)"""
+        session_id, start_time, end_time, duration, cost = session
+        # isoformat дает тот же вид, что SESSION_TIME_FORMAT, без разбора формата
+        start_time = start_time.isoformat(sep=' ', timespec='seconds')
+        end_time = end_time.isoformat(sep=' ', timespec='seconds') if end_time else SESSION_ACTIVE_TEXT
+        return (session_id, start_time, end_time, duration, f"{cost:.2f}")
+
     def update_statistics(self):
-        """Обновление статистики"""
+        """Запуск обновления статистики (запросы к БД выполняются в пуле потоков)"""
+        if self._stats_fetch is not None:
+            self._stats_fetch_pending = True
+            return
+
+        # Виджеты периода читаем в GUI потоке
+        start_date, end_date = self.get_date_range()
+        page = self.page
+
+        self._stats_fetch = DbFetch(lambda: self._fetch_statistics(start_date, end_date, page))
+        self._stats_fetch.signals.done.connect(self.on_statistics_fetched)
+        QThreadPool.globalInstance().start(self._stats_fetch)
+
+    def _fetch_statistics(self, start_date, end_date, page: int):
+        """Чтение итогов за период и строк страницы (выполняется в рабочем потоке)"""
         db_session = self.db.get_session()
         try:
-            # Получаем диапазон дат
-            start_date, end_date = self.get_date_range()
-            
-            # Базовый запрос
-            query = db_session.query(SessionModel).filter_by(client_id=self.client.id)
-            
-            # Применяем фильтр по датам
-            if start_date:
-                query = query.filter(SessionModel.start_time >= start_date)
-            if end_date:
-                query = query.filter(SessionModel.start_time <= end_date)
-            
-            # Сортируем по времени начала
-            sessions = query.order_by(SessionModel.start_time.desc()).all()
-            
-            # Обновляем таблицу
-            self.sessions_table.setRowCount(len(sessions))
-            
-            total_sessions = len(sessions)
-            active_sessions = 0
-            completed_sessions = 0
-            total_duration = 0
-            total_cost = 0.0
-            
-            for row, session in enumerate(sessions):
-                self.sessions_table.setItem(row, 0, QTableWidgetItem(str(session.id)))
-                
-                start_time = session.start_time.strftime("%Y-%m-%d %H:%M:%S")
-                self.sessions_table.setItem(row, 1, QTableWidgetItem(start_time))
-                
-                end_time = session.end_time.strftime("%Y-%m-%d %H:%M:%S") if session.end_time else "Активна"
-                self.sessions_table.setItem(row, 2, QTableWidgetItem(end_time))
-                
-                duration = session.actual_duration if session.actual_duration else 0
-                self.sessions_table.setItem(row, 3, QTableWidgetItem(str(duration)))
-                total_duration += duration
-                
-                cost = session.cost if session.cost else 0.0
-                self.sessions_table.setItem(row, 4, QTableWidgetItem(f"{cost:.2f}"))
-                total_cost += cost
-                
-                # Подсчет статусов
-                if session.status == 'active':
-                    active_sessions += 1
-                elif session.status == 'completed':
-                    completed_sessions += 1
-            
-            # Вычисляем средние значения
-            avg_duration = total_duration / total_sessions if total_sessions > 0 else 0
-            avg_cost = total_cost / total_sessions if total_sessions > 0 else 0
-            
-            # Обновляем сводку
-            self.total_sessions_label.setText(f"Сессий: {total_sessions}")
-            self.active_sessions_label.setText(f"Активных: {active_sessions}")
-            self.completed_sessions_label.setText(f"Завершенных: {completed_sessions}")
-            self.total_time_label.setText(f"Общее время: {total_duration} мин ({total_duration // 60} ч {total_duration % 60} мин)")
-            self.avg_time_label.setText(f"Средн. время: {avg_duration:.1f} мин")
-            self.total_cost_label.setText(f"Общая стоимость: {total_cost:.2f} руб")
-            self.avg_cost_label.setText(f"Средн. стоимость: {avg_cost:.2f} руб")
-            
-        except Exception as e:
-            logger.error(f"Error updating client statistics: {e}")
-            QMessageBox.critical(self, "Ошибка", f"Не удалось обновить статистику:\n{str(e)}")
+            # Итоги за период считает SQLite, строки читаются только для текущей страницы
+            totals = self._filter_sessions(db_session.query(
+                func.count(SessionModel.id),
+                func.coalesce(func.sum(case((SessionModel.status == 'active', 1), else_=0)), 0),
+                func.coalesce(func.sum(case((SessionModel.status == 'completed', 1), else_=0)), 0),
+                func.coalesce(func.sum(SessionModel.actual_duration), 0),
+                func.coalesce(func.sum(SessionModel.cost), 0.0)
+            ), start_date, end_date).one()
+
+            # После очистки статистики страница может оказаться за концом списка
+            page_count = max(1, -(-totals[0] // CLIENT_SESSIONS_PAGE_SIZE))
+            page = min(page, page_count - 1)
+
+            sessions = self._query_session_rows(db_session, start_date, end_date).limit(
+                CLIENT_SESSIONS_PAGE_SIZE
+            ).offset(page * CLIENT_SESSIONS_PAGE_SIZE).all()
+
+            return tuple(totals), page, page_count, [self._session_row(session) for session in sessions]
         finally:
             db_session.close()
 
+    def on_statistics_fetched(self, result):
+        """Применение прочитанной статистики к таблице и сводке (в GUI потоке)"""
+        self._stats_fetch = None
+        if self._closed:
+            return
+
+        # Период или страница сменились во время выборки - перечитываем
+        if self._stats_fetch_pending:
+            self._stats_fetch_pending = False
+            self.update_statistics()
+            return
+
+        if result is None:
+            QMessageBox.critical(self, "Ошибка", "Не удалось обновить статистику")
+            return
+
+        totals, self.page, page_count, rows = result
+        total_sessions, active_sessions, completed_sessions, total_duration, total_cost = totals
+
+        # Обновляем таблицу
+        self.sessions_model.set_rows(rows)
+        self.page_label.setText(f"Страница {self.page + 1} из {page_count}")
+        self.btn_prev_page.setEnabled(self.page > 0)
+        self.btn_next_page.setEnabled(self.page < page_count - 1)
+
+        # Вычисляем средние значения
+        avg_duration = total_duration / total_sessions if total_sessions > 0 else 0
+        avg_cost = total_cost / total_sessions if total_sessions > 0 else 0
+
+        # Обновляем сводку
+        self.total_sessions_label.setText(f"Сессий: {total_sessions}")
+        self.active_sessions_label.setText(f"Активных: {active_sessions}")
+        self.completed_sessions_label.setText(f"Завершенных: {completed_sessions}")
+        self.total_time_label.setText(f"Общее время: {total_duration} мин ({total_duration // 60} ч {total_duration % 60} мин)")
+        self.avg_time_label.setText(f"Средн. время: {avg_duration:.1f} мин")
+        self.total_cost_label.setText(f"Общая стоимость: {total_cost:.2f} руб")
+        self.avg_cost_label.setText(f"Средн. стоимость: {avg_cost:.2f} руб")
+
+    def done(self, result):
+        """Закрытие диалога без ожидания фоновых задач (их результаты будут отброшены)"""
+        self._closed = True
+        super().done(result)
+
     def _register_russian_fonts(self):
         """Регистрирует шрифты с поддержкой кириллицы для PDF экспорта
         
@@ -710,18 +1004,7 @@ class DetailedClientStatisticsDialog(QDialog):
             elements.append(details_label)
             elements.append(Spacer(1, 12))
             
-            # Данные таблицы
-            table_data = [['ID', 'Начало', 'Окончание', 'Длительность', 'Стоимость']]
-            
-            for row in range(self.sessions_table.rowCount()):
-                row_data = []
-                for col in range(self.sessions_table.columnCount()):
-                    item = self.sessions_table.item(row, col)
-                    row_data.append(item.text() if item else "")
-                table_data.append(row_data)
-            
-            sessions_table = Table(table_data, colWidths=[0.5*inch, 1.5*inch, 1.5*inch, 1.2*inch, 1.2*inch])
-            sessions_table.setStyle(TableStyle([
+            sessions_table_style = TableStyle([
                 ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
                 ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
                 ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
@@ -732,15 +1015,26 @@ class DetailedClientStatisticsDialog(QDialog):
                 ('FONTNAME', (0, 1), (-1, -1), font_name),
                 ('GRID', (0, 0), (-1, -1), 1, colors.black),
                 ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ]))
-            
-            elements.append(sessions_table)
+            ])
             
-            # Генерируем PDF
-            doc.build(elements)
+            def build_pdf():
+                """Чтение всех сессий периода и генерация PDF (выполняется в рабочем потоке)"""
+                # Данные таблицы: все сессии периода, а не только текущая страница
+                table_data = [['ID', 'Начало', 'Окончание', 'Длительность', 'Стоимость']]
+                table_data.extend(self._fetch_all_sessions_for_export(start_date, end_date))
+                
+                sessions_table = Table(table_data, colWidths=[0.5*inch, 1.5*inch, 1.5*inch, 1.2*inch, 1.2*inch])
+                sessions_table.setStyle(sessions_table_style)
+                elements.append(sessions_table)
+                
+                # Генерируем PDF
+                doc.build(elements)
+                return filename
             
-            QMessageBox.information(self, "Успех", f"Статистика экспортирована в файл:\n{filename}")
-            logger.info(f"Client statistics exported to {filename}")
+            self.btn_export.setEnabled(False)
+            self._export_fetch = DbFetch(build_pdf)
+            self._export_fetch.signals.done.connect(self.on_client_stats_exported)
+            QThreadPool.globalInstance().start(self._export_fetch)
             
         except ImportError:
             QMessageBox.warning(
@@ -751,6 +1045,32 @@ class DetailedClientStatisticsDialog(QDialog):
             logger.error(f"Error exporting client statistics: {e}", exc_info=True)
             QMessageBox.critical(self, "Ошибка", f"Не удалось экспортировать статистику:\n{str(e)}")
 
+    def _fetch_all_sessions_for_export(self, start_date, end_date):
+        """Строки всех сессий периода для PDF, читаются из БД порциями"""
+        db_session = self.db.get_session()
+        try:
+            query = self._query_session_rows(db_session, start_date, end_date).yield_per(SESSIONS_EXPORT_BATCH_SIZE)
+            for session in query:
+                yield [str(value) for value in self._session_row(session)]
+        finally:
+            db_session.close()
+
+    def on_client_stats_exported(self, filename):
+        """Завершение экспорта в PDF (в GUI потоке)"""
+        self._export_fetch = None
+        if self._closed:
+            if filename is not None:
+                logger.info(f"Client statistics exported to {filename}")
+            return
+        self.btn_export.setEnabled(True)
+
+        if filename is None:
+            QMessageBox.critical(self, "Ошибка", "Не удалось экспортировать статистику, подробности в журнале")
+            return
+
+        QMessageBox.information(self, "Успех", f"Статистика экспортирована в файл:\n{filename}")
+        logger.info(f"Client statistics exported to {filename}")
+
     def clear_statistics(self):
         """Очистка статистики клиента"""
         reply = QMessageBox.question(
@@ -763,36 +1083,44 @@ class DetailedClientStatisticsDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            db_session = self.db.get_session()
-            try:
-                # Получаем диапазон дат
-                start_date, end_date = self.get_date_range()
-                
-                # Базовый запрос
-                query = db_session.query(SessionModel).filter_by(client_id=self.client.id)
-                
-                # Применяем фильтр по датам
-                if start_date:
-                    query = query.filter(SessionModel.start_time >= start_date)
-                if end_date:
-                    query = query.filter(SessionModel.start_time <= end_date)
-                
-                # Удаляем сессии
-                count = query.delete()
-                db_session.commit()
-                
-                QMessageBox.information(self, "Успех", f"Удалено записей: {count}")
-                logger.info(f"Cleared {count} session records for client {self.client.id}")
-                
-                # Обновляем отображение
-                self.update_statistics()
-                
-            except Exception as e:
-                logger.error(f"Error clearing client statistics: {e}")
-                db_session.rollback()
-                QMessageBox.critical(self, "Ошибка", f"Не удалось очистить статистику:\n{str(e)}")
-            finally:
-                db_session.close()
+            start_date, end_date = self.get_date_range()
+
+            self.btn_clear.setEnabled(False)
+            self._clear_fetch = DbFetch(lambda: self._delete_sessions(start_date, end_date))
+            self._clear_fetch.signals.done.connect(self.on_statistics_cleared)
+            QThreadPool.globalInstance().start(self._clear_fetch)
+
+    def _delete_sessions(self, start_date, end_date) -> int:
+        """Удаление сессий клиента за период (выполняется в рабочем потоке)"""
+        db_session = self.db.get_session()
+        try:
+            count = self._filter_sessions(db_session.query(SessionModel), start_date, end_date).delete()
+            db_session.commit()
+            return count
+        except Exception:
+            db_session.rollback()
+            raise
+        finally:
+            db_session.close()
+
+    def on_statistics_cleared(self, count):
+        """Завершение очистки статистики (в GUI потоке)"""
+        self._clear_fetch = None
+        if count is not None:
+            logger.info(f"Cleared {count} session records for client {self.client_id}")
+            self.sessions_cleared.emit()
+        if self._closed:
+            return
+        self.btn_clear.setEnabled(True)
+
+        if count is None:
+            QMessageBox.critical(self, "Ошибка", "Не удалось очистить статистику, подробности в журнале")
+            return
+
+        QMessageBox.information(self, "Успех", f"Удалено записей: {count}")
+
+        # Обновляем отображение
+        self.update_statistics()
 
 
 class MainWindow(QMainWindow):
@@ -801,6 +1129,9 @@ class MainWindow(QMainWindow):
     # Сигнал для уведомления об установке (можно вызывать из другого потока)
     installation_alert_received = pyqtSignal(dict)
 
+    # Сигнал об изменении состояния клиента на сервере (можно вызывать из другого потока)
+    client_state_changed = pyqtSignal(int)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("LibLocker - Панель администратора")
@@ -810,21 +1141,49 @@ class MainWindow(QMainWindow):
         self.db = Database()
         self.config = ServerConfig()
         self.server = LibLockerServer(config=self.config)
-        self.server_thread = None
+        self.server_task = None
+
+        # Таблицы статистики перечитываются только после изменения сессий
+        # (выборка тоже идет в пуле потоков)
+        self._sessions_stale = True
+        self._sessions_fetch = None
+
+        # Выборка клиентов (всей таблицы или измененных строк) идет в пуле потоков
+        # по одной за раз: пока она выполняется, новые запросы обновления откладываются
+        # до ее завершения, поэтому более старый результат не перезапишет более новый
+        self._clients_fetch = None
+        self._clients_fetch_pending = False
+
+        # Уведомления сервера об изменении клиентов копятся в течение короткого окна
+        # и применяются одним запросом (например, при переподключении всех клиентов)
+        self._changed_client_ids = set()
+        self._client_events_timer = QTimer(self)
+        self._client_events_timer.setSingleShot(True)
+        self._client_events_timer.setInterval(CLIENT_EVENTS_COALESCE_MS)
+        self._client_events_timer.timeout.connect(self.refresh_changed_clients)
 
         # Таймеры
+        # Изменения приходят от сервера сигналом, таймер лишь обновляет оставшееся
+        # время сессий и подстраховывает от пропущенных событий.
+        # Период растет, пока таблица не меняется, и сбрасывается при изменениях
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_clients_table)
-        self.update_timer.start(1000)  # Обновление каждую секунду
+        self.update_timer.timeout.connect(self.on_update_timer)
+        self.update_timer.start(CLIENTS_REFRESH_MAX_MS)
         
         # Подключаем сигнал установки к обработчику
         self.installation_alert_received.connect(self.show_installation_alert, Qt.ConnectionType.QueuedConnection)
+        self.client_state_changed.connect(self.queue_client_refresh, Qt.ConnectionType.QueuedConnection)
         
         # Устанавливаем callback для сервера
         self.server.on_installation_alert = self.on_installation_alert_from_server
+        self.server.on_client_changed = self.client_state_changed.emit
+
+        # Диалог выбора длительности создается при первом использовании и переиспользуется
+        self._session_dialog = None
 
         self.init_ui()
         self.load_settings()
+        self.update_clients_table()
         self.start_server()
 
     def init_ui(self):
@@ -835,20 +1194,23 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
 
         # Вкладки
-        tabs = QTabWidget()
-        layout.addWidget(tabs)
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs)
 
         # Вкладка "Клиенты"
         clients_tab = self.create_clients_tab()
-        tabs.addTab(clients_tab, "Клиенты")
+        self._clients_tab_index = self.tabs.addTab(clients_tab, "Клиенты")
 
         # Вкладка "Статистика"
         stats_tab = self.create_stats_tab()
-        tabs.addTab(stats_tab, "Статистика")
+        self._stats_tab_index = self.tabs.addTab(stats_tab, "Статистика")
 
         # Вкладка "Настройки"
         settings_tab = self.create_settings_tab()
-        tabs.addTab(settings_tab, "Настройки")
+        self.tabs.addTab(settings_tab, "Настройки")
+
+        # Данные вкладки загружаются, только когда она открыта
+        self.tabs.currentChanged.connect(self.on_tab_changed)
 
         # Статус бар
         self.statusBar().showMessage("Сервер запускается...")
@@ -860,22 +1222,19 @@ class MainWindow(QMainWindow):
 
         # Заголовок
         header_label = QLabel("Управление клиентами")
-        header_label.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px;")
+        header_label.setObjectName("header")
         layout.addWidget(header_label)
 
         # Таблица клиентов
-        self.clients_table = QTableWidget()
-        self.clients_table.setColumnCount(6)
-        self.clients_table.setHorizontalHeaderLabels([
-            "ID", "Имя", "IP", "Статус", "Время сессии", "Действия"
-        ])
+        self.clients_model = ClientsTableModel(self)
+        self.clients_table = QTableView()
+        self.clients_table.setModel(self.clients_model)
         # Скрываем колонку ID (она остается в данных для внутреннего использования)
         self.clients_table.setColumnHidden(0, True)
         self.clients_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.clients_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.clients_table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
+        self.clients_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.clients_table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
         self.clients_table.setAlternatingRowColors(True)
-        self.clients_table.setStyleSheet(TABLE_STYLE)
         self.clients_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.clients_table.customContextMenuRequested.connect(self.show_client_context_menu)
         layout.addWidget(self.clients_table)
@@ -887,14 +1246,14 @@ class MainWindow(QMainWindow):
         self.btn_start_session.clicked.connect(self.start_session)
         self.btn_start_session.setMinimumHeight(40)
         self.btn_start_session.setMinimumWidth(200)
-        self.btn_start_session.setStyleSheet(BUTTON_STYLE_PRIMARY)
+        self.btn_start_session.setObjectName("primary")
         buttons_layout.addWidget(self.btn_start_session)
 
         self.btn_stop_session = QPushButton("⏹️ Остановить сессию")
         self.btn_stop_session.clicked.connect(self.stop_session)
         self.btn_stop_session.setMinimumHeight(40)
         self.btn_stop_session.setMinimumWidth(200)
-        self.btn_stop_session.setStyleSheet(BUTTON_STYLE_DANGER)
+        self.btn_stop_session.setObjectName("danger")
         buttons_layout.addWidget(self.btn_stop_session)
 
         buttons_layout.addStretch()
@@ -909,7 +1268,7 @@ class MainWindow(QMainWindow):
 
         # Заголовок
         header_label = QLabel("История сессий")
-        header_label.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px;")
+        header_label.setObjectName("header")
         layout.addWidget(header_label)
 
         # Вкладки для разных представлений
@@ -920,15 +1279,14 @@ class MainWindow(QMainWindow):
         all_sessions_widget = QWidget()
         all_sessions_layout = QVBoxLayout(all_sessions_widget)
         
-        self.sessions_table = QTableWidget()
-        self.sessions_table.setColumnCount(6)
-        self.sessions_table.setHorizontalHeaderLabels([
-            "ID", "Клиент", "Начало", "Окончание", "Длительность", "Стоимость"
-        ])
+        self.sessions_model = RowsTableModel(
+            ["ID", "Клиент", "Начало", "Окончание", "Длительность", "Стоимость"], self
+        )
+        self.sessions_table = QTableView()
+        self.sessions_table.setModel(self.sessions_model)
         self.sessions_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.sessions_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.sessions_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.sessions_table.setAlternatingRowColors(True)
-        self.sessions_table.setStyleSheet(TABLE_STYLE)
         all_sessions_layout.addWidget(self.sessions_table)
         
         stats_tabs.addTab(all_sessions_widget, "Все сессии")
@@ -937,15 +1295,12 @@ class MainWindow(QMainWindow):
         by_client_widget = QWidget()
         by_client_layout = QVBoxLayout(by_client_widget)
         
-        self.client_stats_table = QTableWidget()
-        self.client_stats_table.setColumnCount(7)
-        self.client_stats_table.setHorizontalHeaderLabels([
-            "Клиент", "Всего сессий", "Активных", "Общее время (мин)", "Средн. время (мин)", "Средн. стоимость", "Общая стоимость (руб)"
-        ])
+        self.client_stats_model = ClientStatsTableModel(self)
+        self.client_stats_table = QTableView()
+        self.client_stats_table.setModel(self.client_stats_model)
         self.client_stats_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.client_stats_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.client_stats_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.client_stats_table.setAlternatingRowColors(True)
-        self.client_stats_table.setStyleSheet(TABLE_STYLE)
         self.client_stats_table.doubleClicked.connect(self.show_detailed_client_stats)
         by_client_layout.addWidget(self.client_stats_table)
         
@@ -958,29 +1313,26 @@ class MainWindow(QMainWindow):
         self.btn_export_pdf.clicked.connect(self.export_to_pdf)
         self.btn_export_pdf.setMinimumHeight(40)
         self.btn_export_pdf.setMinimumWidth(250)
-        self.btn_export_pdf.setStyleSheet(BUTTON_STYLE_INFO)
+        self.btn_export_pdf.setObjectName("info")
         buttons_layout.addWidget(self.btn_export_pdf)
 
         self.btn_clear_all_stats = QPushButton("🗑️ Очистить всю статистику")
         self.btn_clear_all_stats.clicked.connect(self.clear_all_statistics)
         self.btn_clear_all_stats.setMinimumHeight(40)
         self.btn_clear_all_stats.setMinimumWidth(250)
-        self.btn_clear_all_stats.setStyleSheet(BUTTON_STYLE_DANGER)
+        self.btn_clear_all_stats.setObjectName("danger")
         buttons_layout.addWidget(self.btn_clear_all_stats)
 
         self.btn_refresh_stats = QPushButton("🔄 Обновить")
-        self.btn_refresh_stats.clicked.connect(self.update_sessions_table)
+        self.btn_refresh_stats.clicked.connect(self.refresh_sessions_table)
         self.btn_refresh_stats.setMinimumHeight(40)
         self.btn_refresh_stats.setMinimumWidth(250)
-        self.btn_refresh_stats.setStyleSheet(BUTTON_STYLE_PRIMARY)
+        self.btn_refresh_stats.setObjectName("primary")
         buttons_layout.addWidget(self.btn_refresh_stats)
 
         buttons_layout.addStretch()
         layout.addLayout(buttons_layout)
 
-        # Обновление таблицы сессий
-        self.update_sessions_table()
-
         return widget
 
     def create_settings_tab(self) -> QWidget:
@@ -1008,7 +1360,12 @@ class MainWindow(QMainWindow):
         self.new_password_input = QLineEdit()
         self.new_password_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.new_password_input.setPlaceholderText("Введите новый пароль")
-        self.new_password_input.textChanged.connect(self.check_password_strength)
+        # Надежность проверяется после паузы в наборе, а не на каждое нажатие
+        self._password_check_timer = QTimer(self)
+        self._password_check_timer.setSingleShot(True)
+        self._password_check_timer.setInterval(PASSWORD_CHECK_DELAY_MS)
+        self._password_check_timer.timeout.connect(self.check_password_strength)
+        self.new_password_input.textChanged.connect(self._password_check_timer.start)
         password_form.addRow("Новый пароль:", self.new_password_input)
 
         self.confirm_password_input = QLineEdit()
@@ -1018,7 +1375,7 @@ class MainWindow(QMainWindow):
 
         # Индикатор надежности пароля
         self.password_strength_label = QLabel()
-        self.password_strength_label.setStyleSheet("color: gray; font-style: italic;")
+        self.password_strength_label.setStyleSheet(LABEL_STYLE_HINT)
         password_form.addRow("Надежность:", self.password_strength_label)
 
         security_layout.addLayout(password_form)
@@ -1104,9 +1461,12 @@ class MainWindow(QMainWindow):
 
         return widget
 
-    def _execute_async_command(self, coroutine, success_message: str, error_prefix: str = "Не удалось выполнить команду") -> bool:
+    def _execute_async_command(self, coroutine, success_message: str, error_prefix: str = "Не удалось выполнить команду"):
         """
-        Выполнить асинхронную команду и дождаться результата
+        Запустить асинхронную команду сервера и сообщить о результате
+        
+        Цикл asyncio работает в потоке Qt (qasync), поэтому команда не блокирует
+        интерфейс: результат показывается, когда корутина завершится.
         
         Args:
             coroutine: Корутина для выполнения
@@ -1114,14 +1474,17 @@ class MainWindow(QMainWindow):
             error_prefix: Префикс сообщения об ошибке
             
         Returns:
-            bool: True если операция успешна, False иначе
+            asyncio.Task: Задача, выполняющая команду
         """
+        return asyncio.ensure_future(self._run_async_command(coroutine, success_message, error_prefix))
+
+    async def _run_async_command(self, coroutine, success_message: str, error_prefix: str) -> bool:
+        """Выполнить команду и показать результат (см. _execute_async_command)"""
         try:
-            future = asyncio.run_coroutine_threadsafe(coroutine, self.server_thread.loop)
-            result = future.result(timeout=ASYNC_OPERATION_TIMEOUT)
+            result = await asyncio.wait_for(coroutine, timeout=ASYNC_OPERATION_TIMEOUT)
             
             if result:
-                QMessageBox.information(self, "Успех", success_message)
+                self.statusBar().showMessage(success_message, STATUS_MESSAGE_TIMEOUT_MS)
                 return True
             else:
                 QMessageBox.warning(
@@ -1129,7 +1492,7 @@ class MainWindow(QMainWindow):
                     f"{error_prefix}.\nКлиент не подключен или произошла ошибка."
                 )
                 return False
-        except TimeoutError:
+        except asyncio.TimeoutError:
             QMessageBox.warning(
                 self, "Ошибка", 
                 f"Время ожидания истекло при выполнении операции"
@@ -1141,184 +1504,339 @@ class MainWindow(QMainWindow):
             return False
 
     def start_server(self):
-        """Запуск WebSocket сервера"""
-        self.server_thread = ServerThread(self.server)
-        self.server_thread.start()
+        """Запуск WebSocket сервера в цикле asyncio главного потока"""
+        self.server_task = asyncio.ensure_future(self.server.run())
         self.statusBar().showMessage("Сервер запущен")
-        logger.info("Server thread started")
+        logger.info("Server task started")
+
+    async def stop_server(self):
+        """Остановка сервера с закрытием сокетов и веб-сервера"""
+        if self.server_task and not self.server_task.done():
+            self.server_task.cancel()
+            try:
+                await self.server_task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Server stopped")
+
+    def on_tab_changed(self, index: int):
+        """Обновление открытой вкладки"""
+        if index == self._clients_tab_index:
+            self.update_clients_table()
+        elif index == self._stats_tab_index:
+            self.update_sessions_table()
+
+    def on_update_timer(self):
+        """Периодическое обновление таблицы клиентов, пока она видна"""
+        if self.tabs.currentIndex() != self._clients_tab_index:
+            return
+        self.update_clients_table()
 
     def update_clients_table(self):
-        """Обновление таблицы клиентов"""
+        """Запуск обновления таблицы клиентов (запрос к БД выполняется в пуле потоков)"""
+        if self._clients_fetch is not None:
+            self._clients_fetch_pending = True
+            return
+
+        # Список подключенных клиентов читаем в GUI потоке, где работает сервер
+        connected_client_ids = {info['client_id'] for info in self.server.connected_clients.values()}
+
+        # Ссылка на задачу держит ее сигналы живыми до получения результата
+        self._clients_fetch = DbFetch(lambda: self._fetch_clients_rows(connected_client_ids))
+        self._clients_fetch.signals.done.connect(self.on_clients_rows_fetched)
+        QThreadPool.globalInstance().start(self._clients_fetch)
+
+    def _fetch_clients_rows(self, connected_client_ids: set) -> list:
+        """Чтение строк таблицы клиентов (выполняется в рабочем потоке)"""
         db_session = self.db.get_session()
         try:
             # Сортируем клиентов по display_order, затем по id
-            clients = db_session.query(ClientModel).order_by(ClientModel.display_order, ClientModel.id).all()
-            self.clients_table.setRowCount(len(clients))
+            clients = self._query_clients(db_session).order_by(ClientModel.display_order, ClientModel.id).all()
+            active_sessions = self._query_active_sessions(db_session)
+            # Одно текущее время на всю таблицу: строки показывают согласованный срез
+            now = datetime.now()
+
+            return [
+                self._build_client_row(client, active_sessions.get(client.id), connected_client_ids, now)
+                for client in clients
+            ]
+        finally:
+            db_session.close()
 
-            # Получаем список подключенных клиентов
-            connected_client_ids = {info['client_id'] for info in self.server.connected_clients.values()}
+    def on_clients_rows_fetched(self, rows):
+        """Применение прочитанных строк к модели клиентов (в GUI потоке)"""
+        self._clients_fetch = None
 
-            for row, client in enumerate(clients):
-                self.clients_table.setItem(row, 0, QTableWidgetItem(str(client.id)))
-                self.clients_table.setItem(row, 1, QTableWidgetItem(client.name))
-                self.clients_table.setItem(row, 2, QTableWidgetItem(client.ip_address or ""))
+        if rows is not None and self.clients_model.set_rows(rows):
+            # Таблица изменилась - следующие изменения скорее всего рядом
+            interval = CLIENTS_REFRESH_MIN_MS
+        else:
+            interval = min(CLIENTS_REFRESH_MAX_MS, self.update_timer.interval() * 2)
+        self.update_timer.setInterval(interval)
+
+        self._run_deferred_clients_refresh()
+
+    def _run_deferred_clients_refresh(self):
+        """Запуск обновления клиентов, отложенного на время предыдущей выборки"""
+        if self._clients_fetch_pending:
+            self._clients_fetch_pending = False
+            self.update_clients_table()
+        elif self._changed_client_ids:
+            self.refresh_changed_clients()
+
+    def queue_client_refresh(self, client_id: int):
+        """Запомнить клиента, о смене состояния которого сообщил сервер"""
+        self._changed_client_ids.add(client_id)
+        if not self._client_events_timer.isActive():
+            self._client_events_timer.start()
+
+    def refresh_changed_clients(self):
+        """Обновление строк клиентов, накопленных с прошлого обновления"""
+        if self._clients_fetch is not None:
+            # Строки будут перечитаны после завершения текущей выборки
+            return
+        client_ids = self._changed_client_ids
+        self._changed_client_ids = set()
+        if client_ids:
+            self.refresh_client_rows(client_ids)
+
+    def refresh_client_rows(self, client_ids):
+        """Запуск обновления строк нескольких клиентов одним запросом (в пуле потоков)"""
+        # События сервера сопровождают начало и конец сессий и смену имени клиента
+        self.invalidate_sessions()
+
+        if self._clients_fetch is not None:
+            self._changed_client_ids.update(client_ids)
+            return
 
-                # Определяем реальный статус на основе подключения
-                is_connected = client.id in connected_client_ids
-                
-                # Локализация статуса
-                if is_connected:
-                    if client.status == ClientStatus.IN_SESSION.value:
-                        status_text = "В сессии"
-                        status_color = QColor(173, 216, 230)  # Светло-голубой
-                    else:
-                        status_text = "Онлайн"
-                        status_color = QColor(144, 238, 144)  # Светло-зеленый
-                else:
-                    status_text = "Оффлайн"
-                    status_color = QColor(211, 211, 211)  # Светло-серый
-
-                status_item = QTableWidgetItem(status_text)
-                status_item.setBackground(status_color)
-                self.clients_table.setItem(row, 3, status_item)
-
-                # Время сессии - получаем из активной сессии
-                time_text = ""
-                if client.status == ClientStatus.IN_SESSION.value:
-                    active_session = db_session.query(SessionModel).filter_by(
-                        client_id=client.id,
-                        status='active'
-                    ).first()
-                    
-                    if active_session:
-                        from datetime import datetime, timedelta
-                        if active_session.is_unlimited:
-                            # Для безлимита показываем прошедшее время
-                            elapsed = datetime.now() - active_session.start_time
-                            elapsed_minutes = int(elapsed.total_seconds() / 60)
-                            hours = elapsed_minutes // 60
-                            minutes = elapsed_minutes % 60
-                            time_text = f"∞ {hours:02d}:{minutes:02d}"
-                        else:
-                            # Для ограниченных сессий показываем оставшееся время
-                            end_time = active_session.start_time + timedelta(minutes=active_session.duration_minutes)
-                            remaining = end_time - datetime.now()
-                            remaining_seconds = remaining.total_seconds()
-                            
-                            # Показываем "Завершается..." только если время истекло более 5 секунд назад
-                            # (защита от небольших расхождений в синхронизации времени)
-                            if remaining_seconds < -5:
-                                time_text = "Завершается..."
-                            else:
-                                # Показываем оставшееся время, даже если оно немного отрицательное
-                                # (округляем до 0, чтобы не показывать отрицательные значения)
-                                remaining_minutes = max(0, int(remaining_seconds / 60))
-                                hours = remaining_minutes // 60
-                                minutes = remaining_minutes % 60
-                                time_text = f"{hours:02d}:{minutes:02d} осталось"
-                
-                self.clients_table.setItem(row, 4, QTableWidgetItem(time_text))
+        if any(self.clients_model.row_of(client_id) is None for client_id in client_ids):
+            # Новый клиент - место строки зависит от display_order, перестраиваем таблицу
+            self.update_clients_table()
+            return
 
-                # Действия (пока пусто)
-                self.clients_table.setItem(row, 5, QTableWidgetItem(""))
+        client_ids = set(client_ids)
+        connected_client_ids = {info['client_id'] for info in self.server.connected_clients.values()}
 
-        except Exception as e:
-            logger.error(f"Error updating clients table: {e}")
+        self._clients_fetch = DbFetch(lambda: self._fetch_changed_client_rows(client_ids, connected_client_ids))
+        self._clients_fetch.signals.done.connect(self.on_changed_client_rows_fetched)
+        QThreadPool.globalInstance().start(self._clients_fetch)
+
+    def _fetch_changed_client_rows(self, client_ids: set, connected_client_ids: set) -> tuple:
+        """Чтение строк измененных клиентов (выполняется в рабочем потоке)
+
+        Returns:
+            tuple: (запрошенные ID, {client_id: строка таблицы})
+        """
+        db_session = self.db.get_session()
+        try:
+            clients = self._query_clients(db_session).filter(ClientModel.id.in_(client_ids)).all()
+            active_sessions = self._query_active_sessions(db_session, client_ids)
+            now = datetime.now()
+            return client_ids, {
+                client.id: self._build_client_row(client, active_sessions.get(client.id), connected_client_ids, now)
+                for client in clients
+            }
         finally:
             db_session.close()
 
+    def on_changed_client_rows_fetched(self, result):
+        """Применение прочитанных строк измененных клиентов (в GUI потоке)"""
+        self._clients_fetch = None
+
+        if result is None:
+            # Выборка не удалась - перечитываем всю таблицу
+            self._clients_fetch_pending = True
+        else:
+            client_ids, rows = result
+            if len(rows) != len(client_ids):
+                # Клиент удален - перестраиваем таблицу
+                self._clients_fetch_pending = True
+            else:
+                # Выборки идут по одной, поэтому строки клиентов с ее начала не сдвигались
+                self.clients_model.update_rows({
+                    self.clients_model.row_of(client_id): row for client_id, row in rows.items()
+                })
+                # Сервер сообщил об изменении - ненадолго учащаем опрос
+                self.update_timer.setInterval(CLIENTS_REFRESH_MIN_MS)
+
+        self._run_deferred_clients_refresh()
+
+    @staticmethod
+    def _query_clients(db_session):
+        """Запрос колонок клиентов, нужных таблице (без загрузки ORM-объектов)"""
+        return db_session.query(ClientModel.id, ClientModel.name, ClientModel.ip_address, ClientModel.status)
+
+    @staticmethod
+    def _query_active_sessions(db_session, client_ids=None) -> dict:
+        """Активные сессии одним запросом: {client_id: (start_time, duration_minutes, is_unlimited)}"""
+        query = db_session.query(
+            SessionModel.client_id, SessionModel.start_time,
+            SessionModel.duration_minutes, SessionModel.is_unlimited
+        ).filter(SessionModel.status == 'active')
+        if client_ids is not None:
+            query = query.filter(SessionModel.client_id.in_(client_ids))
+        # При нескольких активных сессиях берется самая ранняя, как раньше в .first()
+        return {session.client_id: session for session in query.order_by(SessionModel.id.desc())}
+
+    def _build_client_row(self, client, active_session, connected_client_ids: set, now: datetime) -> tuple:
+        """Строка таблицы клиентов: (id, имя, IP, статус, время сессии) на момент now"""
+        # Определяем реальный статус на основе подключения
+        is_connected = client.id in connected_client_ids
+        
+        # Локализация статуса
+        if is_connected:
+            if client.status == ClientStatus.IN_SESSION.value:
+                status_text = "В сессии"
+            else:
+                status_text = "Онлайн"
+        else:
+            status_text = "Оффлайн"
+
+        # Время сессии - получаем из активной сессии
+        time_text = ""
+        if client.status == ClientStatus.IN_SESSION.value:
+            if active_session:
+                if active_session.is_unlimited:
+                    # Для безлимита показываем прошедшее время
+                    elapsed = now - active_session.start_time
+                    elapsed_minutes = int(elapsed.total_seconds() / 60)
+                    hours = elapsed_minutes // 60
+                    minutes = elapsed_minutes % 60
+                    time_text = f"∞ {hours:02d}:{minutes:02d}"
+                else:
+                    # Для ограниченных сессий показываем оставшееся время
+                    end_time = active_session.start_time + timedelta(minutes=active_session.duration_minutes)
+                    remaining = end_time - now
+                    remaining_seconds = remaining.total_seconds()
+                    
+                    # Показываем "Завершается..." только если время истекло более 5 секунд назад
+                    # (защита от небольших расхождений в синхронизации времени)
+                    if remaining_seconds < -5:
+                        time_text = "Завершается..."
+                    else:
+                        # Показываем оставшееся время, даже если оно немного отрицательное
+                        # (округляем до 0, чтобы не показывать отрицательные значения)
+                        remaining_minutes = max(0, int(remaining_seconds / 60))
+                        hours = remaining_minutes // 60
+                        minutes = remaining_minutes % 60
+                        time_text = f"{hours:02d}:{minutes:02d} осталось"
+
+        return (client.id, client.name, client.ip_address or "", status_text, time_text)
+
+    def invalidate_sessions(self):
+        """Отметить таблицы статистики как устаревшие"""
+        self._sessions_stale = True
+
+    def refresh_sessions_table(self):
+        """Принудительно перечитать таблицы статистики"""
+        self.invalidate_sessions()
+        self.update_sessions_table()
+
     def update_sessions_table(self):
-        """Обновление таблицы сессий"""
+        """Обновление таблиц статистики (если сессии менялись с прошлого обновления)"""
+        if not self._sessions_stale or self._sessions_fetch is not None:
+            # Изменения во время выборки подхватываются после ее завершения
+            return
+
+        self._sessions_stale = False
+        self._sessions_fetch = DbFetch(self._fetch_sessions_data)
+        self._sessions_fetch.signals.done.connect(self.on_sessions_data_fetched)
+        QThreadPool.globalInstance().start(self._sessions_fetch)
+
+    def _fetch_sessions_data(self) -> tuple:
+        """Чтение строк таблиц сессий и статистики по клиентам (выполняется в рабочем потоке)"""
         db_session = self.db.get_session()
         try:
-            sessions = db_session.query(SessionModel).order_by(
+            # Имя клиента получаем тем же запросом, без отдельного запроса на каждую строку.
+            # Строки для отображения форматирует SQLite, в Python остается только упаковка в кортежи
+            sessions = db_session.query(
+                SessionModel.id,
+                func.coalesce(ClientModel.name, 'Unknown'),
+                func.strftime(SESSION_TIME_FORMAT, SessionModel.start_time),
+                func.coalesce(func.strftime(SESSION_TIME_FORMAT, SessionModel.end_time), SESSION_ACTIVE_TEXT),
+                case(
+                    (func.coalesce(SessionModel.actual_duration, 0) != 0,
+                     func.printf('%d мин', SessionModel.actual_duration)),
+                    else_='-'
+                ),
+                case(
+                    (SessionModel.cost > 0, func.printf('%.2f руб.', SessionModel.cost)),
+                    else_='Бесплатно'
+                )
+            ).outerjoin(
+                ClientModel, SessionModel.client_id == ClientModel.id
+            ).order_by(
                 SessionModel.start_time.desc()
             ).limit(100).all()
 
-            self.sessions_table.setRowCount(len(sessions))
-
-            for row, session in enumerate(sessions):
-                self.sessions_table.setItem(row, 0, QTableWidgetItem(str(session.id)))
-
-                # Имя клиента
-                client = db_session.query(ClientModel).filter_by(id=session.client_id).first()
-                client_name = client.name if client else "Unknown"
-                self.sessions_table.setItem(row, 1, QTableWidgetItem(client_name))
-
-                # Время начала
-                start_time = session.start_time.strftime("%Y-%m-%d %H:%M:%S")
-                self.sessions_table.setItem(row, 2, QTableWidgetItem(start_time))
-
-                # Время окончания
-                end_time = session.end_time.strftime("%Y-%m-%d %H:%M:%S") if session.end_time else "Активна"
-                self.sessions_table.setItem(row, 3, QTableWidgetItem(end_time))
+            rows = [tuple(session) for session in sessions]
+            return rows, self._fetch_client_stats(db_session)
+        finally:
+            db_session.close()
 
-                # Длительность
-                duration = f"{session.actual_duration} мин" if session.actual_duration else "-"
-                self.sessions_table.setItem(row, 4, QTableWidgetItem(duration))
+    def on_sessions_data_fetched(self, data):
+        """Применение прочитанной статистики к таблицам (в GUI потоке)"""
+        self._sessions_fetch = None
 
-                # Стоимость
-                cost = f"{session.cost:.2f} руб." if session.cost > 0 else "Бесплатно"
-                self.sessions_table.setItem(row, 5, QTableWidgetItem(cost))
+        if data is None:
+            # Выборка не удалась - повторим при следующем обращении
+            self._sessions_stale = True
+            return
 
-            # Обновление статистики по клиентам
-            self.update_client_stats_table(db_session)
+        rows, client_stats = data
+        self.sessions_model.set_rows(rows)
+
+        # Обновление статистики по клиентам
+        self.update_client_stats_table(client_stats)
+
+        if self._sessions_stale:
+            # Сессии изменились, пока шла выборка
+            self.update_sessions_table()
+
+    @staticmethod
+    def _fetch_client_stats(db_session) -> list:
+        """Статистика по клиентам: (id, имя, сессий, активных, время, средн. время, средн. стоимость, стоимость)"""
+        # Получаем всех клиентов (только нужные колонки, без загрузки ORM-объектов)
+        clients = db_session.query(ClientModel.id, ClientModel.name).all()
+
+        # Итоги по сессиям всех клиентов считает SQLite одним запросом с группировкой,
+        # строки сессий в Python не читаются
+        totals = {
+            client_id: client_totals
+            for client_id, *client_totals in db_session.query(
+                SessionModel.client_id,
+                func.count(SessionModel.id),
+                func.coalesce(func.sum(case((SessionModel.status == 'active', 1), else_=0)), 0),
+                func.coalesce(func.sum(SessionModel.actual_duration), 0),
+                func.coalesce(func.sum(SessionModel.cost), 0.0)
+            ).group_by(SessionModel.client_id)
+        }
+
+        stats = []
+        for client in clients:
+            total_sessions, active_count, total_duration, total_cost = totals.get(client.id, (0, 0, 0, 0.0))
+            avg_duration = total_duration / total_sessions if total_sessions > 0 else 0
+            avg_cost = total_cost / total_sessions if total_sessions > 0 else 0
 
-        except Exception as e:
-            logger.error(f"Error updating sessions table: {e}")
-        finally:
-            db_session.close()
+            stats.append((
+                client.id, client.name, total_sessions, active_count,
+                total_duration, avg_duration, avg_cost, total_cost
+            ))
+        return stats
 
-    def update_client_stats_table(self, db_session):
+    def update_client_stats_table(self, client_stats: list):
         """Обновление таблицы статистики по клиентам"""
-        try:
-            # Получаем всех клиентов
-            clients = db_session.query(ClientModel).all()
-            
-            self.client_stats_table.setRowCount(len(clients))
-            
-            for row, client in enumerate(clients):
-                # Получаем все сессии клиента
-                sessions = db_session.query(SessionModel).filter_by(client_id=client.id).all()
-                active_sessions = [s for s in sessions if s.status == 'active']
-                
-                # Подсчитываем статистику с обработкой None значений
-                total_sessions = len(sessions)
-                active_count = len(active_sessions)
-                total_duration = sum(s.actual_duration or 0 for s in sessions)
-                total_cost = sum(s.cost or 0 for s in sessions)
-                avg_duration = total_duration / total_sessions if total_sessions > 0 else 0
-                avg_cost = total_cost / total_sessions if total_sessions > 0 else 0
-                
-                # Заполняем таблицу
-                self.client_stats_table.setItem(row, 0, QTableWidgetItem(client.name))
-                self.client_stats_table.setItem(row, 1, QTableWidgetItem(str(total_sessions)))
-                self.client_stats_table.setItem(row, 2, QTableWidgetItem(str(active_count)))
-                self.client_stats_table.setItem(row, 3, QTableWidgetItem(f"{total_duration:.0f}"))
-                self.client_stats_table.setItem(row, 4, QTableWidgetItem(f"{avg_duration:.1f}"))
-                self.client_stats_table.setItem(row, 5, QTableWidgetItem(f"{avg_cost:.2f}"))
-                self.client_stats_table.setItem(row, 6, QTableWidgetItem(f"{total_cost:.2f}"))
-                
-                # Сохраняем ID клиента в первом элементе строки для последующего использования
-                item = self.client_stats_table.item(row, 0)
-                if item:
-                    item.setData(Qt.ItemDataRole.UserRole, client.id)
-                
-        except Exception as e:
-            logger.error(f"Error updating client stats table: {e}")
+        self.client_stats_model.set_rows([
+            (name, total_sessions, active_count, f"{total_duration:.0f}", f"{avg_duration:.1f}",
+             f"{avg_cost:.2f}", f"{total_cost:.2f}", client_id)
+            for (client_id, name, total_sessions, active_count,
+                 total_duration, avg_duration, avg_cost, total_cost) in client_stats
+        ])
 
     def show_detailed_client_stats(self, index):
         """Показать детальную статистику по клиенту"""
         try:
-            row = index.row()
-            # Получаем ID клиента из данных первого элемента строки
-            item = self.client_stats_table.item(row, 0)
-            if not item:
-                return
-            
-            client_id = item.data(Qt.ItemDataRole.UserRole)
-            if not client_id:
-                return
+            client_id = self.client_stats_model.client_id(index.row())
             
             # Получаем клиента из БД
             db_session = self.db.get_session()
@@ -1327,6 +1845,8 @@ class MainWindow(QMainWindow):
                 if client:
                     # Открываем диалог детальной статистики
                     dialog = DetailedClientStatisticsDialog(client, self.db, self)
+                    # Очистка статистики в диалоге может завершиться и после его закрытия
+                    dialog.sessions_cleared.connect(self.refresh_sessions_table)
                     dialog.exec()
                 else:
                     QMessageBox.warning(self, "Ошибка", "Клиент не найден")
@@ -1337,22 +1857,29 @@ class MainWindow(QMainWindow):
             logger.error(f"Error showing detailed client stats: {e}", exc_info=True)
             QMessageBox.critical(self, "Ошибка", f"Не удалось открыть детальную статистику:\n{str(e)}")
 
+    def _selected_client_ids(self) -> List[int]:
+        """ID клиентов в выделенных строках таблицы"""
+        model = self.clients_model
+        return [model.client_id(index.row()) for index in self.clients_table.selectionModel().selectedRows()]
+
+    def _get_session_dialog(self) -> SessionDialog:
+        """Диалог выбора длительности сессии, сброшенный к начальному состоянию"""
+        if self._session_dialog is None:
+            self._session_dialog = SessionDialog(self)
+        else:
+            self._session_dialog.reset()
+        return self._session_dialog
+
     def start_session(self):
         """Начать сессию для выбранных клиентов"""
-        selected_rows = self.clients_table.selectionModel().selectedRows()
-        if not selected_rows:
+        # Получаем ID всех выбранных клиентов
+        client_ids = self._selected_client_ids()
+        if not client_ids:
             QMessageBox.warning(self, "Ошибка", "Выберите клиент(ов)")
             return
 
-        # Получаем ID всех выбранных клиентов
-        client_ids = []
-        for index in selected_rows:
-            row = index.row()
-            client_id = int(self.clients_table.item(row, 0).text())
-            client_ids.append(client_id)
-
         # Открываем диалог создания сессии
-        dialog = SessionDialog(self)
+        dialog = self._get_session_dialog()
         if dialog.exec() == QDialog.DialogCode.Accepted:
             duration, is_unlimited = dialog.get_duration()
 
@@ -1372,31 +1899,46 @@ class MainWindow(QMainWindow):
         hourly_rate: float, free_mode: bool
     ):
         """Helper method to start sessions for multiple clients"""
-        results = []
-        for client_id in client_ids:
-            try:
-                result = await self.server.start_session(
-                    client_id, duration, is_unlimited, hourly_rate, free_mode
-                )
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error starting session for client {client_id}: {e}")
-                results.append(False)
-        return all(results)
+        return await self._gather_client_commands(
+            client_ids,
+            lambda client_id: self.server.start_session(
+                client_id, duration, is_unlimited, hourly_rate, free_mode
+            ),
+            "starting session"
+        )
+
+    async def _gather_client_commands(self, client_ids: List[int], command, action: str) -> bool:
+        """
+        Выполнить команду сервера для нескольких клиентов одновременно
+
+        Args:
+            client_ids: ID клиентов
+            command: функция client_id -> корутина команды сервера
+            action: описание действия для журнала
+
+        Returns:
+            bool: True если команда выполнена для всех клиентов
+        """
+        results = await asyncio.gather(
+            *(command(client_id) for client_id in client_ids),
+            return_exceptions=True
+        )
+        success = True
+        for client_id, result in zip(client_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error {action} for client {client_id}: {result}")
+                success = False
+            elif not result:
+                success = False
+        return success
 
     def edit_session_time(self):
         """Изменить время активной сессии для выбранных клиентов"""
-        selected_rows = self.clients_table.selectionModel().selectedRows()
-        if not selected_rows:
+        # Получаем ID всех выбранных клиентов
+        client_ids = self._selected_client_ids()
+        if not client_ids:
             QMessageBox.warning(self, "Ошибка", "Выберите клиент(ов)")
             return
-
-        # Получаем ID всех выбранных клиентов
-        client_ids = []
-        for index in selected_rows:
-            row = index.row()
-            client_id = int(self.clients_table.item(row, 0).text())
-            client_ids.append(client_id)
         
         # Проверяем, есть ли активные сессии у всех выбранных клиентов
         db_session = self.db.get_session()
@@ -1420,8 +1962,8 @@ class MainWindow(QMainWindow):
                 return
             
             # Открываем диалог для ввода нового времени
-            dialog = SessionDialog(self)
-            
+            dialog = self._get_session_dialog()
+
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 duration, is_unlimited = dialog.get_duration()
                 
@@ -1448,25 +1990,20 @@ class MainWindow(QMainWindow):
 
     async def _update_session_time_bulk(self, client_ids: List[int], duration: int):
         """Helper method to update session time for multiple clients"""
-        results = []
-        for client_id in client_ids:
-            try:
-                result = await self.server.update_session_time(client_id, duration)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error updating session time for client {client_id}: {e}")
-                results.append(False)
-        return all(results)
+        return await self._gather_client_commands(
+            client_ids,
+            lambda client_id: self.server.update_session_time(client_id, duration),
+            "updating session time"
+        )
 
     def edit_session_tariff(self):
         """Изменить тарификацию активной сессии"""
-        selected_rows = self.clients_table.selectedItems()
-        if not selected_rows:
+        client_ids = self._selected_client_ids()
+        if not client_ids:
             QMessageBox.warning(self, "Ошибка", "Выберите клиента")
             return
 
-        row = selected_rows[0].row()
-        client_id = int(self.clients_table.item(row, 0).text())
+        client_id = client_ids[0]
         
         # Проверяем, есть ли активная сессия
         db_session = self.db.get_session()
@@ -1534,18 +2071,12 @@ class MainWindow(QMainWindow):
 
     def stop_session(self):
         """Остановить сессию для выбранных клиентов"""
-        selected_rows = self.clients_table.selectionModel().selectedRows()
-        if not selected_rows:
+        # Получаем ID всех выбранных клиентов
+        client_ids = self._selected_client_ids()
+        if not client_ids:
             QMessageBox.warning(self, "Ошибка", "Выберите клиент(ов)")
             return
 
-        # Получаем ID всех выбранных клиентов
-        client_ids = []
-        for index in selected_rows:
-            row = index.row()
-            client_id = int(self.clients_table.item(row, 0).text())
-            client_ids.append(client_id)
-
         # Останавливаем сессии для всех выбранных клиентов
         self._execute_async_command(
             self._stop_sessions_bulk(client_ids),
@@ -1555,48 +2086,41 @@ class MainWindow(QMainWindow):
 
     async def _stop_sessions_bulk(self, client_ids: List[int]):
         """Helper method to stop sessions for multiple clients"""
-        results = []
-        for client_id in client_ids:
-            try:
-                result = await self.server.stop_session(client_id)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error stopping session for client {client_id}: {e}")
-                results.append(False)
-        return all(results)
+        return await self._gather_client_commands(client_ids, self.server.stop_session, "stopping session")
 
     def shutdown_client(self):
-        """Выключить компьютер клиента"""
-        selected_rows = self.clients_table.selectedItems()
-        if not selected_rows:
-            QMessageBox.warning(self, "Ошибка", "Выберите клиента")
+        """Выключить компьютеры выбранных клиентов"""
+        client_ids = self._selected_client_ids()
+        if not client_ids:
+            QMessageBox.warning(self, "Ошибка", "Выберите клиент(ов)")
             return
 
-        row = selected_rows[0].row()
-        client_id = int(self.clients_table.item(row, 0).text())
+        if len(client_ids) == 1:
+            confirmation_message = "Вы уверены, что хотите выключить этот компьютер?"
+        else:
+            confirmation_message = f"Вы уверены, что хотите выключить {len(client_ids)} компьютер(ов)?"
 
         reply = QMessageBox.question(
             self, "Подтверждение",
-            "Вы уверены, что хотите выключить этот компьютер?",
+            confirmation_message,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
 
         if reply == QMessageBox.StandardButton.Yes:
             self._execute_async_command(
-                self.server.shutdown_client(client_id),
-                success_message="Команда выключения отправлена",
+                self._gather_client_commands(client_ids, self.server.shutdown_client, "sending shutdown"),
+                success_message=f"Команда выключения отправлена для {len(client_ids)} клиент(ов)",
                 error_prefix="Не удалось отправить команду выключения"
             )
 
     def toggle_installation_monitor(self):
         """Переключить мониторинг установки для выбранного клиента"""
-        selected_rows = self.clients_table.selectedItems()
-        if not selected_rows:
+        client_ids = self._selected_client_ids()
+        if not client_ids:
             QMessageBox.warning(self, "Ошибка", "Выберите клиента")
             return
 
-        row = selected_rows[0].row()
-        client_id = int(self.clients_table.item(row, 0).text())
+        client_id = client_ids[0]
 
         # Получаем текущее состояние из базы данных
         db_session = self.db.get_session()
@@ -1622,12 +2146,12 @@ class MainWindow(QMainWindow):
     def show_client_context_menu(self, position):
         """Показать контекстное меню для клиента"""
         # Получаем выбранную строку
-        selected_items = self.clients_table.selectedItems()
+        selected_items = self.clients_table.selectionModel().selectedRows()
         if not selected_items:
             return
         
         row = selected_items[0].row()
-        client_id = int(self.clients_table.item(row, 0).text())
+        client_id = self.clients_model.client_id(row)
         
         # Создаем контекстное меню
         menu = QMenu(self)
@@ -1640,7 +2164,7 @@ class MainWindow(QMainWindow):
         
         move_down_action = QAction("⬇️ Переместить вниз", self)
         move_down_action.triggered.connect(self.move_client_down)
-        move_down_action.setEnabled(row < self.clients_table.rowCount() - 1)  # Отключаем, если уже последний
+        move_down_action.setEnabled(row < self.clients_model.rowCount() - 1)  # Отключаем, если уже последний
         menu.addAction(move_down_action)
         
         menu.addSeparator()
@@ -1684,18 +2208,12 @@ class MainWindow(QMainWindow):
     
     def unlock_client(self):
         """Разблокировать выбранных клиентов (снять красный экран и экран конца сессии)"""
-        selected_rows = self.clients_table.selectionModel().selectedRows()
-        if not selected_rows:
+        # Получаем ID всех выбранных клиентов
+        client_ids = self._selected_client_ids()
+        if not client_ids:
             QMessageBox.warning(self, "Ошибка", "Выберите клиент(ов)")
             return
 
-        # Получаем ID всех выбранных клиентов
-        client_ids = []
-        for index in selected_rows:
-            row = index.row()
-            client_id = int(self.clients_table.item(row, 0).text())
-            client_ids.append(client_id)
-
         # Формируем сообщение подтверждения в зависимости от количества клиентов
         if len(client_ids) == 1:
             confirmation_message = UNLOCK_CONFIRMATION_MESSAGE
@@ -1720,15 +2238,7 @@ class MainWindow(QMainWindow):
 
     async def _unlock_clients_bulk(self, client_ids: List[int]):
         """Helper method to unlock multiple clients"""
-        results = []
-        for client_id in client_ids:
-            try:
-                result = await self.server.unlock_client(client_id)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error unlocking client {client_id}: {e}")
-                results.append(False)
-        return all(results)
+        return await self._gather_client_commands(client_ids, self.server.unlock_client, "unlocking")
 
     def delete_client(self):
         """Удалить выбранного клиента из базы данных"""
@@ -1739,8 +2249,8 @@ class MainWindow(QMainWindow):
 
         # Получаем информацию о клиенте
         row = selected_rows[0].row()
-        client_id = int(self.clients_table.item(row, 0).text())
-        client_name = self.clients_table.item(row, 1).text()
+        client_id = self.clients_model.client_id(row)
+        client_name = self.clients_model.client_name(row)
         
         # Получаем информацию о сессиях клиента
         db_session = self.db.get_session()
@@ -1774,10 +2284,11 @@ class MainWindow(QMainWindow):
                 
                 # Обновляем таблицу
                 self.update_clients_table()
+                self.invalidate_sessions()
                 
-                QMessageBox.information(
-                    self, "Успех", 
-                    f"Клиент '{client_name}' и {session_count} сессий успешно удалены"
+                self.statusBar().showMessage(
+                    f"Клиент '{client_name}' и {session_count} сессий успешно удалены",
+                    STATUS_MESSAGE_TIMEOUT_MS
                 )
                 logger.info(f"Client {client_id} ({client_name}) deleted with {session_count} sessions")
                 
@@ -1798,8 +2309,8 @@ class MainWindow(QMainWindow):
         if row == 0:  # Уже первый
             return
         
-        client_id = int(self.clients_table.item(row, 0).text())
-        client_above_id = int(self.clients_table.item(row - 1, 0).text())
+        client_id = self.clients_model.client_id(row)
+        client_above_id = self.clients_model.client_id(row - 1)
         
         # Меняем местами display_order
         db_session = self.db.get_session()
@@ -1833,11 +2344,11 @@ class MainWindow(QMainWindow):
             return
         
         row = selected_rows[0].row()
-        if row >= self.clients_table.rowCount() - 1:  # Уже последний
+        if row >= self.clients_model.rowCount() - 1:  # Уже последний
             return
         
-        client_id = int(self.clients_table.item(row, 0).text())
-        client_below_id = int(self.clients_table.item(row + 1, 0).text())
+        client_id = self.clients_model.client_id(row)
+        client_below_id = self.clients_model.client_id(row + 1)
         
         # Меняем местами display_order
         db_session = self.db.get_session()
@@ -1882,7 +2393,10 @@ class MainWindow(QMainWindow):
             self.config.set('installation_monitor', 'alert_volume', str(self.installation_alert_volume_spin.value()))
 
             self.config.save()
-            QMessageBox.information(self, "Успех", "Настройки сохранены\n\nСетевые настройки вступят в силу после перезапуска сервера.")
+            self.statusBar().showMessage(
+                "Настройки сохранены. Сетевые настройки вступят в силу после перезапуска сервера.",
+                STATUS_MESSAGE_TIMEOUT_MS
+            )
             logger.info("Settings saved successfully")
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", f"Не удалось сохранить настройки:\n{str(e)}")
@@ -1890,6 +2404,14 @@ class MainWindow(QMainWindow):
 
     def load_settings(self):
         """Загрузить настройки из конфига"""
+        # Загрузка значений не должна запускать обработчики изменений полей
+        widgets = (
+            self.free_mode_check, self.hourly_rate_spin, self.rounding_spin,
+            self.port_spin, self.web_port_spin, self.web_server_enabled_check,
+            self.installation_monitor_enabled_check, self.installation_alert_volume_spin
+        )
+        for widget in widgets:
+            widget.blockSignals(True)
         try:
             self.free_mode_check.setChecked(self.config.free_mode)
             self.hourly_rate_spin.setValue(self.config.hourly_rate)
@@ -1902,15 +2424,18 @@ class MainWindow(QMainWindow):
             logger.info("Settings loaded successfully")
         except Exception as e:
             logger.error(f"Error loading settings: {e}")
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
 
     def update_password_status(self):
         """Обновить статус пароля"""
         if self.config.admin_password_hash:
             self.password_status.setText("✅ Установлен")
-            self.password_status.setStyleSheet("color: green; font-weight: bold;")
+            self.password_status.setStyleSheet(LABEL_STYLE_GOOD)
         else:
             self.password_status.setText("❌ Не установлен")
-            self.password_status.setStyleSheet("color: red; font-weight: bold;")
+            self.password_status.setStyleSheet(LABEL_STYLE_BAD)
 
     def check_password_strength(self):
         """Проверить надежность пароля"""
@@ -1918,9 +2443,23 @@ class MainWindow(QMainWindow):
         
         if not password:
             self.password_strength_label.setText("")
-            self.password_strength_label.setStyleSheet("color: gray; font-style: italic;")
+            self.password_strength_label.setStyleSheet(LABEL_STYLE_HINT)
             return
 
+        # Классы символов определяем за один проход по паролю
+        has_digit = has_alpha = has_upper = has_lower = has_special = False
+        for c in password:
+            if c.isdigit():
+                has_digit = True
+            elif c.isalpha():
+                has_alpha = True
+                if c.isupper():
+                    has_upper = True
+                elif c.islower():
+                    has_lower = True
+            elif not c.isalnum():
+                has_special = True
+
         strength = 0
         feedback = []
 
@@ -1931,35 +2470,35 @@ class MainWindow(QMainWindow):
             feedback.append(f"минимум {MIN_PASSWORD_LENGTH} символов")
 
         # Наличие цифр
-        if any(c.isdigit() for c in password):
+        if has_digit:
             strength += 1
         else:
             feedback.append("добавьте цифры")
 
         # Наличие букв
-        if any(c.isalpha() for c in password):
+        if has_alpha:
             strength += 1
         else:
             feedback.append("добавьте буквы")
 
         # Наличие спецсимволов
-        if any(not c.isalnum() for c in password):
+        if has_special:
             strength += 1
 
         # Наличие заглавных и строчных букв
-        if any(c.isupper() for c in password) and any(c.islower() for c in password):
+        if has_upper and has_lower:
             strength += 1
 
         # Отображение надежности
         if strength <= 2:
             self.password_strength_label.setText("⚠️ Слабый" + (" (" + ", ".join(feedback) + ")" if feedback else ""))
-            self.password_strength_label.setStyleSheet("color: red; font-weight: bold;")
+            self.password_strength_label.setStyleSheet(LABEL_STYLE_BAD)
         elif strength == 3:
             self.password_strength_label.setText("⚡ Средний")
-            self.password_strength_label.setStyleSheet("color: orange; font-weight: bold;")
+            self.password_strength_label.setStyleSheet(LABEL_STYLE_FAIR)
         else:
             self.password_strength_label.setText("✅ Надежный")
-            self.password_strength_label.setStyleSheet("color: green; font-weight: bold;")
+            self.password_strength_label.setStyleSheet(LABEL_STYLE_GOOD)
 
     def set_admin_password(self):
         """Установить пароль администратора"""
@@ -2006,13 +2545,10 @@ class MainWindow(QMainWindow):
                     raise save_error
 
                 # Broadcast password update to all connected clients
-                if self.server and self.server_thread and self.server_thread.loop:
+                if self.server and self.server_task:
                     try:
-                        # Schedule the coroutine in the server's event loop (thread-safe)
-                        asyncio.run_coroutine_threadsafe(
-                            self.server.broadcast_password_update(hashed),
-                            self.server_thread.loop
-                        )
+                        # Schedule the coroutine in the server's event loop
+                        asyncio.ensure_future(self.server.broadcast_password_update(hashed))
                         logger.info("Password update scheduled for broadcast to clients")
                     except Exception as broadcast_error:
                         logger.error(f"Error broadcasting password update: {broadcast_error}")
@@ -2032,21 +2568,19 @@ class MainWindow(QMainWindow):
                 self.update_password_status()
 
                 # More accurate success message
-                if self.server and self.server_thread and self.server_thread.loop:
+                if self.server and self.server_task:
                     connected_count = len(self.server.connected_clients)
-                    QMessageBox.information(
-                        self, 
-                        "Успех", 
-                        f"Пароль администратора успешно установлен!\n\n"
-                        f"Обновление отправлено {connected_count} подключенным клиентам.\n"
-                        f"Офлайн-клиенты получат обновление при подключении."
+                    self.statusBar().showMessage(
+                        f"Пароль администратора успешно установлен. "
+                        f"Обновление отправлено {connected_count} подключенным клиентам, "
+                        f"офлайн-клиенты получат его при подключении.",
+                        STATUS_MESSAGE_TIMEOUT_MS
                     )
                 else:
-                    QMessageBox.information(
-                        self, 
-                        "Успех", 
-                        "Пароль администратора успешно установлен!\n\n"
-                        "Обновление будет отправлено клиентам при их подключении."
+                    self.statusBar().showMessage(
+                        "Пароль администратора успешно установлен. "
+                        "Обновление будет отправлено клиентам при их подключении.",
+                        STATUS_MESSAGE_TIMEOUT_MS
                     )
                 logger.info("Admin password set successfully")
             except Exception as e:
@@ -2170,12 +2704,9 @@ class MainWindow(QMainWindow):
                 # Данные таблицы клиентов
                 clients_table_data = [['Клиент', 'Всего сессий', 'Активных', 'Время (мин)', 'Средн. время', 'Средн. стоимость', 'Общая стоимость']]
                 
-                for row in range(self.client_stats_table.rowCount()):
-                    row_data = []
-                    for col in range(self.client_stats_table.columnCount()):
-                        item = self.client_stats_table.item(row, col)
-                        row_data.append(item.text() if item else "")
-                    clients_table_data.append(row_data)
+                for values in self.client_stats_model.rows:
+                    # Последний элемент строки - ID клиента, в отчет не выводится
+                    clients_table_data.append([str(value) for value in values[:-1]])
                 
                 clients_table = Table(clients_table_data, colWidths=[1.8*inch, 0.9*inch, 0.9*inch, 1*inch, 1*inch, 1.2*inch, 1.2*inch])
                 clients_table.setStyle(TableStyle([
@@ -2203,12 +2734,8 @@ class MainWindow(QMainWindow):
                 # Данные таблицы сессий
                 sessions_table_data = [['ID', 'Клиент', 'Начало', 'Окончание', 'Длительность', 'Стоимость']]
                 
-                for row in range(min(self.sessions_table.rowCount(), 100)):
-                    row_data = []
-                    for col in range(self.sessions_table.columnCount()):
-                        item = self.sessions_table.item(row, col)
-                        row_data.append(item.text() if item else "")
-                    sessions_table_data.append(row_data)
+                for values in self.sessions_model.rows[:100]:
+                    sessions_table_data.append([str(value) for value in values])
                 
                 sessions_table = Table(sessions_table_data, colWidths=[0.5*inch, 1.5*inch, 1.8*inch, 1.8*inch, 1.3*inch, 1.3*inch])
                 sessions_table.setStyle(TableStyle([
@@ -2277,7 +2804,7 @@ class MainWindow(QMainWindow):
                     logger.info(f"Cleared all statistics: {count} session records deleted")
                     
                     # Обновляем отображение
-                    self.update_sessions_table()
+                    self.refresh_sessions_table()
                     
                 except Exception as e:
                     logger.error(f"Error clearing all statistics: {e}")
@@ -2286,7 +2813,7 @@ class MainWindow(QMainWindow):
                 finally:
                     db_session.close()
             else:
-                QMessageBox.information(self, "Отмена", "Операция отменена")
+                self.statusBar().showMessage("Операция отменена", STATUS_MESSAGE_TIMEOUT_MS)
 
     def closeEvent(self, event):
         """Обработка закрытия окна"""
@@ -2297,10 +2824,10 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            # Остановка сервера
-            if self.server_thread:
-                self.server_thread.terminate()
-                self.server_thread.wait()
+            # Сервер останавливается в main() после выхода из цикла Qt
+            self.update_timer.stop()
+            self._client_events_timer.stop()
+            QThreadPool.globalInstance().waitForDone()
             event.accept()
         else:
             event.ignore()
@@ -2354,9 +2881,22 @@ def main():
     )
 
     app = QApplication(sys.argv)
+    # Стили кнопок, таблиц и заголовков разбираются один раз на все приложение
+    app.setStyleSheet(APP_STYLE)
+
+    # Цикл asyncio работает поверх цикла Qt: сервер и интерфейс в одном потоке
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
+
+    app_close_event = asyncio.Event()
+    app.aboutToQuit.connect(app_close_event.set)
+
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
+
+    with loop:
+        loop.run_until_complete(app_close_event.wait())
+        loop.run_until_complete(window.stop_server())
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ WebSocket сервер для LibLocker
 import asyncio
 import json
 import logging
+import sys
 from datetime import datetime
 from typing import Dict, Optional, Callable
 import socketio
@@ -15,6 +16,13 @@ from ..shared.models import Client, ClientStatus
 from ..shared.database import Database, ClientModel, SessionModel
 from ..shared.discovery import ServerAnnouncer
 
+# uvloop - более быстрый цикл asyncio (только не-Windows, для запуска без GUI)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = sys.platform != 'win32'
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Константы по умолчанию
@@ -47,6 +55,9 @@ class LibLockerServer:
         # Callback для обработки уведомлений об установке
         self.on_installation_alert: Optional[Callable] = None
 
+        # Callback об изменении состояния клиента (аргумент - client_id)
+        self.on_client_changed: Optional[Callable] = None
+
         # Объявление сервера в сети для автоматического обнаружения
         self.announcer = ServerAnnouncer(port=self.port, name="LibLocker Server")
 
@@ -113,6 +124,14 @@ class LibLockerServer:
         else:
             logger.warning(f"Unknown message type: {msg_type}")
 
+    def _notify_client_changed(self, client_id: int):
+        """Сообщить подписчику об изменении статуса или сессии клиента"""
+        if self.on_client_changed:
+            try:
+                self.on_client_changed(client_id)
+            except Exception as e:
+                logger.error(f"Error calling client changed callback: {e}", exc_info=True)
+
     def _get_client_sid(self, client_id: int) -> Optional[str]:
         """
         Получить socket ID (sid) клиента по его ID в базе данных.
@@ -194,6 +213,7 @@ class LibLockerServer:
             }, room=sid)
 
             logger.info(f"Client registered: {name} (ID: {client.id})")
+            self._notify_client_changed(client.id)
 
         except Exception as e:
             logger.error(f"Error registering client: {e}")
@@ -221,9 +241,15 @@ class LibLockerServer:
                     id=client_info['client_id']
                 ).first()
                 if client:
+                    old_status = client.status
+                    new_status = data.get('status', ClientStatus.ONLINE.value)
                     client.last_seen = datetime.now()
-                    client.status = data.get('status', ClientStatus.ONLINE.value)
+                    client.status = new_status
                     db_session.commit()
+                    
+                    # Heartbeat приходит постоянно - сообщаем только о смене статуса
+                    if new_status != old_status:
+                        self._notify_client_changed(client_info['client_id'])
             except Exception as e:
                 logger.error(f"Error updating heartbeat: {e}")
                 db_session.rollback()
@@ -306,6 +332,7 @@ class LibLockerServer:
 
             # Удаляем из списка подключенных
             del self.connected_clients[sid]
+            self._notify_client_changed(client_info['client_id'])
 
     async def start_session(self, client_id: int, duration_minutes: int = 0,
                           is_unlimited: bool = False, cost_per_hour: float = 0.0,
@@ -367,6 +394,7 @@ class LibLockerServer:
             await self.sio.emit('message', message_dict, room=client_sid)
 
             logger.info(f"Session {session_id} started for client {client_id}")
+            self._notify_client_changed(client_id)
             
             # Автоматически включаем мониторинг установки если это настроено в конфиге
             if self.config.installation_monitor_enabled:
@@ -453,6 +481,7 @@ class LibLockerServer:
                 final_cost = active_session.cost
                 db_session.commit()
                 logger.info(f"Session {active_session.id} stopped")
+                self._notify_client_changed(client_id)
 
         except Exception as e:
             logger.error(f"Error stopping session: {e}")
@@ -513,6 +542,7 @@ class LibLockerServer:
             await self.sio.emit('message', update_msg.to_message().to_dict(), room=client_sid)
 
             logger.info(f"Session time updated for client {client_id}")
+            self._notify_client_changed(client_id)
             return True
 
         except Exception as e:
@@ -719,5 +749,8 @@ if __name__ == "__main__":
 
     # Запуск сервера
     server = LibLockerServer()
-    asyncio.run(server.run())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(server.run())
+    else:
+        asyncio.run(server.run())
 
@@ -5,7 +5,7 @@ SQLAlchemy модели
 import os
 from contextlib import contextmanager
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Enum
+from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, Session
 import enum
@@ -68,6 +68,13 @@ class SessionModel(Base):
     # Связи
     client = relationship("ClientModel", back_populates="sessions")
 
+    # Индексы для выборки последних сессий (ORDER BY start_time DESC LIMIT ...)
+    # и для постраничной выборки и итогов по одному клиенту за период
+    __table_args__ = (
+        Index('ix_session_start_time', start_time.desc()),
+        Index('ix_session_client_start_time', client_id, start_time),
+    )
+
     def __repr__(self):
         return f"<Session(id={self.id}, client_id={self.client_id}, status='{self.status}')>"
 
@@ -126,6 +133,12 @@ class Database:
                 if 'free_mode' not in columns:
                     conn.execute(text('ALTER TABLE sessions ADD COLUMN free_mode BOOLEAN DEFAULT 1'))
                 
+                # Индекс по времени начала в базах, созданных до его появления
+                conn.execute(text('CREATE INDEX IF NOT EXISTS ix_session_start_time ON sessions (start_time DESC)'))
+                conn.execute(text(
+                    'CREATE INDEX IF NOT EXISTS ix_session_client_start_time ON sessions (client_id, start_time)'
+                ))
+                
                 conn.commit()
         
         # Проверяем таблицу clients
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Тест учета известных файлов в папках загрузок монитора установки
+"""
+import sys
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Добавляем путь к src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.client.installation_monitor import InstallationMonitor
+
+
+class TestKnownFiles(unittest.TestCase):
+    """Тесты начального состояния и опроса папок загрузок"""
+
+    def setUp(self):
+        """Настройка теста: временная папка вместо папок загрузок пользователя"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.folder = Path(self.tmp.name)
+
+        patcher = patch.object(InstallationMonitor, 'DOWNLOAD_FOLDERS', [self.folder])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _create(self, name: str) -> str:
+        path = self.folder / name
+        path.write_bytes(b"test")
+        return str(path)
+
+    def test_existing_files_not_reported(self):
+        """Файлы, лежавшие до запуска, не считаются новыми (включая имена вида '.exe')"""
+        dot_only = self._create(".exe")
+        upper = self._create("Setup.MSI")
+        self._create("notes.txt")
+
+        monitor = InstallationMonitor()
+
+        self.assertIn(dot_only, monitor.known_files)
+        self.assertIn(upper, monitor.known_files)
+        self.assertEqual(len(monitor.known_files), 2)
+        self.assertFalse(monitor._check_download_folders(), "Уже существующие файлы не должны вызывать тревогу")
+        print("✓ Начальное состояние и опрос одинаково распознают установочные файлы")
+
+    def test_new_file_reported(self):
+        """Новый установочный файл обнаруживается при опросе"""
+        monitor = InstallationMonitor()
+        self._create("installer.exe")
+
+        self.assertTrue(monitor._check_download_folders())
+        print("✓ Новый установочный файл обнаружен")
+
+    @patch.object(InstallationMonitor, 'KNOWN_FILES_LIMIT', 3)
+    def test_lru_eviction(self):
+        """Сверх KNOWN_FILES_LIMIT вытесняется самая старая запись, повторно увиденная остается"""
+        monitor = InstallationMonitor()
+        monitor._remember_file("a")
+        monitor._remember_file("b")
+        monitor._remember_file("c")
+
+        # Повторное обращение к "a" делает ее самой свежей
+        monitor._remember_file("a")
+        monitor._remember_file("d")
+
+        self.assertEqual(list(monitor.known_files), ["c", "a", "d"])
+        self.assertNotIn("b", monitor.known_files, "Самая старая запись должна быть вытеснена")
+        print("✓ Самая старая запись вытесняется, повторно увиденная сохраняется")
+
+    @patch.object(InstallationMonitor, 'KNOWN_FILES_LIMIT', 2)
+    def test_rescan_keeps_seen_file(self):
+        """Файл, снова найденный при опросе, не вытесняется новыми файлами"""
+        kept = self._create("kept.exe")
+        monitor = InstallationMonitor()
+        monitor._remember_file("old")
+
+        # Опрос снова видит kept.exe и переносит его в конец очереди
+        self.assertFalse(monitor._check_download_folders())
+        monitor._remember_file("new")
+
+        self.assertIn(kept, monitor.known_files)
+        self.assertNotIn("old", monitor.known_files)
+        print("✓ Файл, найденный повторно, остается в известных")
+
+
+if __name__ == '__main__':
+    unittest.main()
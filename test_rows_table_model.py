@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Тест модели таблиц сервера: обновление строк без полной перестройки
+"""
+import sys
+import os
+import unittest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Добавляем путь к src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PyQt6.QtWidgets import QApplication
+
+from src.server.gui import RowsTableModel
+
+
+class TestRowsTableModel(unittest.TestCase):
+    """Тесты RowsTableModel.set_rows / update_rows"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.model = RowsTableModel(["ID", "Имя", "Статус"])
+        self.changed = []
+        self.inserted = []
+        self.removed = []
+        self.model.dataChanged.connect(lambda top, bottom: self.changed.append((top.row(), bottom.row())))
+        self.model.rowsInserted.connect(lambda parent, first, last: self.inserted.append((first, last)))
+        self.model.rowsRemoved.connect(lambda parent, first, last: self.removed.append((first, last)))
+
+    def cells(self):
+        """Содержимое модели, прочитанное через data()"""
+        return [
+            [self.model.data(self.model.index(row, col)) for col in range(self.model.columnCount())]
+            for row in range(self.model.rowCount())
+        ]
+
+    def test_grow(self):
+        """Добавление строк: вставляются только новые, старые не меняются"""
+        self.assertTrue(self.model.set_rows([(1, "PC1", "Онлайн")]))
+        self.assertTrue(self.model.set_rows([(1, "PC1", "Онлайн"), (2, "PC2", "Оффлайн"), (3, "PC3", "Оффлайн")]))
+
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.cells(), [["1", "PC1", "Онлайн"], ["2", "PC2", "Оффлайн"], ["3", "PC3", "Оффлайн"]])
+        self.assertEqual(self.inserted, [(0, 0), (1, 2)])
+        self.assertEqual(self.changed, [])
+        print("✓ Новые строки добавляются без изменения существующих")
+
+    def test_shrink(self):
+        """Удаление строк с конца таблицы"""
+        self.model.set_rows([(1, "PC1", "Онлайн"), (2, "PC2", "Оффлайн"), (3, "PC3", "Оффлайн")])
+        self.assertTrue(self.model.set_rows([(1, "PC1", "Онлайн")]))
+
+        self.assertEqual(self.model.rowCount(), 1)
+        self.assertEqual(self.cells(), [["1", "PC1", "Онлайн"]])
+        self.assertEqual(self.removed, [(1, 2)])
+        self.assertEqual(self.changed, [])
+        print("✓ Лишние строки удаляются")
+
+    def test_change_in_place(self):
+        """Изменение строки: dataChanged только для нее, повтор без изменений ничего не сообщает"""
+        rows = [(1, "PC1", "Онлайн"), (2, "PC2", "Оффлайн")]
+        self.model.set_rows(rows)
+
+        self.assertTrue(self.model.set_rows([(1, "PC1", "Онлайн"), (2, "PC2", "В сессии")]))
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual(self.cells(), [["1", "PC1", "Онлайн"], ["2", "PC2", "В сессии"]])
+        self.assertEqual(self.changed, [(1, 1)])
+
+        self.assertFalse(self.model.set_rows([(1, "PC1", "Онлайн"), (2, "PC2", "В сессии")]))
+        self.assertEqual(self.changed, [(1, 1)])
+        print("✓ Изменившаяся строка обновляется на месте")
+
+    def test_update_rows(self):
+        """update_rows: одно уведомление на диапазон изменившихся строк"""
+        self.model.set_rows([(1, "PC1", "Онлайн"), (2, "PC2", "Оффлайн"), (3, "PC3", "Оффлайн")])
+
+        self.model.update_rows({0: (1, "PC1", "В сессии"), 1: (2, "PC2", "Оффлайн"), 2: (3, "PC3", "Онлайн")})
+
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.cells(), [["1", "PC1", "В сессии"], ["2", "PC2", "Оффлайн"], ["3", "PC3", "Онлайн"]])
+        self.assertEqual(self.changed, [(0, 2)])
+        print("✓ update_rows сообщает об изменениях одним сигналом")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Тест общего монитора установки: подсчет ссылок и получатели сигнала
+"""
+import sys
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+# Добавляем путь к src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.client import installation_monitor
+from src.client.installation_monitor import (
+    InstallationMonitor, get_installation_monitor, release_installation_monitor
+)
+
+
+class TestSharedInstallationMonitor(unittest.TestCase):
+    """Тесты get_installation_monitor / release_installation_monitor"""
+
+    def setUp(self):
+        """Настройка теста: без реальных папок загрузок"""
+        patcher = patch.object(InstallationMonitor, 'DOWNLOAD_FOLDERS', [])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Очистка после теста: освобождаем оставшиеся ссылки"""
+        while installation_monitor._GLOBAL_MONITOR is not None:
+            release_installation_monitor()
+
+    def test_refcount_start_stop(self):
+        """Два владельца: монитор работает, пока не освобождена последняя ссылка"""
+        first, second = Mock(), Mock()
+
+        monitor = get_installation_monitor(signal_emitter=first)
+        self.assertIs(get_installation_monitor(signal_emitter=second), monitor)
+        self.assertTrue(monitor.enabled)
+
+        release_installation_monitor(first)
+        self.assertTrue(monitor.enabled, "Монитор должен работать, пока есть вторая ссылка")
+
+        release_installation_monitor(second)
+        self.assertFalse(monitor.enabled, "Последняя ссылка должна остановить монитор")
+        self.assertIsNone(installation_monitor._GLOBAL_MONITOR)
+        print("✓ Монитор останавливается только после последнего освобождения")
+
+    def test_released_emitter_not_notified(self):
+        """Освобожденный получатель больше не получает сигнал тревоги"""
+        first, second = Mock(), Mock()
+
+        monitor = get_installation_monitor(signal_emitter=first)
+        get_installation_monitor(signal_emitter=second)
+        release_installation_monitor(first)
+
+        monitor._trigger_alert("Test")
+
+        first.installation_detected.emit.assert_not_called()
+        second.installation_detected.emit.assert_called_once_with("Test")
+        print("✓ Сигнал получают только текущие владельцы")
+
+    @patch.object(installation_monitor, 'PSUTIL_AVAILABLE', True)
+    def test_later_caller_enables_process_monitor(self):
+        """Запрос мониторинга процессов от второго владельца не игнорируется"""
+        monitor = get_installation_monitor(signal_emitter=Mock())
+        self.assertFalse(monitor.enable_process_monitor)
+
+        with patch.object(InstallationMonitor, '_iter_processes', return_value=iter([(42, 'setup.exe', None)])):
+            get_installation_monitor(signal_emitter=Mock(), enable_process_monitor=True)
+
+        self.assertTrue(monitor.enable_process_monitor)
+        self.assertIn(42, monitor.known_processes, "Уже запущенные установщики не должны считаться новыми")
+        print("✓ Мониторинг процессов включается для общего монитора")
+
+
+if __name__ == '__main__':
+    unittest.main()